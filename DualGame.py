@@ -1,7 +1,16 @@
-from UserVsMinimax import TicTacToe
+from game import TicTacToe
 import tkinter as tk
 from minimax import best_move  # Import the best_move function from minimax.py
 from minimax import check_winner
+from ai_worker import AIWorker
+
+
+def warm_minimax():
+    # O replies always follow an X move, so these nine searches cover real play
+    for square in range(9):
+        board = [" "] * 9
+        board[square] = "X"
+        best_move(board)
 
 
 class TicTacToeDualGUI:
@@ -73,6 +82,15 @@ class TicTacToeDualGUI:
         self.q_wins = 0
         self.minimax_wins = 0
 
+        # Minimax searches run on a worker so the window stays responsive
+        self.thinking_label = tk.Label(
+            root, text="", font="normal 12 italic", bg="lightyellow"
+        )
+        self.thinking_label.grid(row=7, column=0, columnspan=7)
+        self.worker = AIWorker(root, indicator=self.thinking_label)
+        # Fill the search cache from every opening X move before the first reply
+        self.worker.warm_up(warm_minimax)
+
     def create_board(self, buttons, start_row, label_text, col_offset):
         label = tk.Label(
             self.root,
@@ -87,6 +105,8 @@ class TicTacToeDualGUI:
 
     def player_move_qlearning(self, i):
         # Handle player move on Q-learning board
+        if self.worker.busy():  # Wait for the Minimax AI to finish its move
+            return
         if self.game_qlearning.board[i] == " ":
             self.q_buttons[i].config(text="X", fg="blue")
             self.game_qlearning.make_move(i, "X")
@@ -94,6 +114,7 @@ class TicTacToeDualGUI:
             # Overwrite Minimax board with player's move
             self.minimax_buttons[i].config(text="X", fg="blue")
             self.game_minimax.board[i] = "X"
+            self.game_minimax.sync()
 
             if self.game_qlearning.current_winner:
                 self.q_wins += 1
@@ -110,11 +131,12 @@ class TicTacToeDualGUI:
             self.q_buttons[q_move].config(text="O", fg="red")
             self.game_qlearning.make_move(q_move, "O")
 
-        # Minimax AI makes its move based on the updated state
-        move_minimax = best_move(self.game_minimax.board)
-        while move_minimax is not None and self.game_minimax.board[move_minimax] != " ":
-            move_minimax = best_move(self.game_minimax.board)
+        # Minimax AI makes its move based on the updated state, searching a copy
+        self.worker.submit(
+            best_move, self.game_minimax.board[:], self.finish_minimax_move
+        )
 
+    def finish_minimax_move(self, move_minimax):
         if move_minimax is not None:
             self.minimax_buttons[move_minimax].config(text="O", fg="red")
             self.game_minimax.make_move(move_minimax, "O")
@@ -156,7 +178,8 @@ class TicTacToeDualGUI:
         win_label.grid(row=6, column=1, columnspan=4)
 
     def restart_game(self):
-        # Reset both game boards
+        # Drop any search still running, then reset both game boards
+        self.worker.cancel()
         self.game_qlearning.reset()
         self.game_minimax.reset()
 
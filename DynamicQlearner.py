@@ -1,12 +1,21 @@
 import math
 import random
+from q_agent import QTableAgent
 
 
-class QLearningAI:
+class QLearningAI(QTableAgent):
     def __init__(
-        self, alpha=1.0, gamma=0.5, epsilon=1.0, decay_rate=0.001, max_trials=10000
+        self,
+        alpha=1.0,
+        gamma=0.5,
+        epsilon=1.0,
+        decay_rate=0.001,
+        max_trials=10000,
+        canonical=False,
+        dense=False,
+        trace_decay=None,
     ):
-        self.q_table = {}  # Stores Q-values
+        self.init_table(canonical, dense, trace_decay)
         self.alpha_initial = alpha
         self.gamma_initial = gamma
         self.epsilon_initial = epsilon
@@ -25,6 +34,10 @@ class QLearningAI:
     def dynamic_epsilon(self):
         return self.epsilon_initial * math.exp(-self.decay_rate * self.trial_count)
 
+    def learning_rates(self):
+        # Decayed over the trials so far
+        return self.dynamic_alpha(), self.dynamic_gamma()
+
     def choose_action(self, state, available_moves):
         self.trial_count += 1
         epsilon = self.dynamic_epsilon()
@@ -34,7 +47,8 @@ class QLearningAI:
         else:
             # Exploitation: choose the best action based on Q-values
             q_values = [
-                self.q_table.get((tuple(state), move), 0) for move in available_moves
+                self.q_table.get(self.state_key(state, move), 0)
+                for move in available_moves
             ]
             max_q = max(q_values)
             best_moves = [
@@ -46,16 +60,16 @@ class QLearningAI:
         alpha = self.dynamic_alpha()
         gamma = self.dynamic_gamma()
 
-        current_q = self.q_table.get((tuple(state), action), 0)
+        current_q = self.q_table.get(self.state_key(state, action), 0)
         max_future_q = max(
             [
-                self.q_table.get((tuple(next_state), move), 0)
+                self.q_table.get(self.state_key(next_state, move), 0)
                 for move in available_moves
             ],
             default=0,
         )
 
         # Update Q-value using the Q-learning formula
-        self.q_table[(tuple(state), action)] = current_q + alpha * (
+        self.q_table[self.state_key(state, action)] = current_q + alpha * (
             reward + gamma * max_future_q - current_q
         )
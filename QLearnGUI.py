@@ -1,16 +1,27 @@
 import tkinter as tk
 import random
-import numpy as np
+import threading
 
 
 class QLearningTicTacToe:
     def __init__(self):
-        self.q_table = {}  # State-action mapping
+        self._q_table = None  # State-action values, one float32 row per state
+        self.table_lock = threading.Lock()
         self.learning_rate = 0.1  # Alpha
         self.discount_factor = 0.9  # Gamma
         self.epsilon = 0.3  # Exploration probability
         self.reset()
 
+    @property
+    def q_table(self):
+        # Built on first use so NumPy is not imported before the window appears
+        with self.table_lock:
+            if self._q_table is None:
+                from dense_qtable import DenseQTable
+
+                self._q_table = DenseQTable()
+        return self._q_table
+
     def reset(self):
         self.board = [" "] * 9
         self.current_player = "X"
@@ -54,23 +65,18 @@ class QLearningTicTacToe:
             move = random.choice(self.available_moves())
         else:
             # Exploitation: Best known move
-            if state not in self.q_table:
-                self.q_table[state] = np.zeros(9)  # Initialize Q-values
-            q_values = self.q_table[state]
+            q_values = self.q_table.row(state)
             move = max(self.available_moves(), key=lambda x: q_values[x])
 
         self.make_move(move, "O")
         return move
 
     def update_q_table(self, state, action, reward, next_state):
-        if state not in self.q_table:
-            self.q_table[state] = np.zeros(9)
-        if next_state not in self.q_table:
-            self.q_table[next_state] = np.zeros(9)
-
-        q_predict = self.q_table[state][action]
-        q_target = reward + self.discount_factor * max(self.q_table[next_state])
-        self.q_table[state][action] += self.learning_rate * (q_target - q_predict)
+        q_predict = self.q_table.get((state, action))
+        q_target = reward + self.discount_factor * self.q_table.max_value(next_state)
+        self.q_table[(state, action)] = q_predict + self.learning_rate * (
+            q_target - q_predict
+        )
 
 
 class TicTacToeGUI:
@@ -87,6 +93,8 @@ class TicTacToeGUI:
         self.wins = 0
         self.losses = 0
         self.draws = 0
+        # Build the Q-table in the background while the player makes a first move
+        threading.Thread(target=lambda: self.game.q_table, daemon=True).start()
 
     def create_board(self):
         for i in range(9):
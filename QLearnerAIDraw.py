@@ -40,8 +40,16 @@ def get_game_result(winner):
 
 
 # Example usage in your game loop:
-winner = "X"  # or "O" or "tie"
-reward = get_game_result(winner)
-
-# Update the Q-learning AI with the result
-q_ai.update_q_table(state, action, reward, next_state, available_moves)
+if __name__ == "__main__":
+    q_ai = QLearningAI()
+    state = [" "] * 9
+    action = 4
+    next_state = state[:]
+    next_state[action] = "X"
+    available_moves = [i for i, spot in enumerate(next_state) if spot == " "]
+
+    winner = "X"  # or "O" or "tie"
+    reward = get_game_result(winner)
+
+    # Update the Q-learning AI with the result
+    q_ai.update_q_table(state, action, reward, next_state, available_moves)
@@ -1,29 +1,38 @@
 import random
+from q_agent import QTableAgent
 
 
-class QLearningAI:
-    def __init__(self, alpha=0.4, gamma=0.9, epsilon=0.5):
-        self.q_table = {}
+class QLearningAI(QTableAgent):
+    def __init__(
+        self,
+        alpha=0.4,
+        gamma=0.9,
+        epsilon=0.5,
+        canonical=False,
+        dense=False,
+        trace_decay=None,
+    ):
+        self.init_table(canonical, dense, trace_decay)
         self.alpha = alpha
         self.gamma = gamma
         self.epsilon = epsilon
 
-    def get_q_value(self, state, action):
-        return self.q_table.get((tuple(state), action), 0.0)
+    def learning_rates(self):
+        return self.alpha, self.gamma
 
     def choose_action(self, state, available_moves):
         if random.random() < self.epsilon:
             return random.choice(available_moves)
-        q_values = {move: self.get_q_value(state, move) for move in available_moves}
+        q_values = self.action_values(state, available_moves)
         max_q = max(q_values.values())
         return random.choice([move for move, q in q_values.items() if q == max_q])
 
     def update_q_table(self, state, action, reward, next_state, available_moves):
         current_q = self.get_q_value(state, action)
         max_next_q = max(
-            [self.get_q_value(next_state, move) for move in available_moves], default=0
+            self.action_values(next_state, available_moves).values(), default=0
         )
         new_q = (1 - self.alpha) * current_q + self.alpha * (
             reward + self.gamma * max_next_q
         )
-        self.q_table[(tuple(state), action)] = new_q
+        self.q_table[self.state_key(state, action)] = new_q
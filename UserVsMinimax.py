@@ -1,71 +1,44 @@
+import argparse
+import functools
 import tkinter as tk
-from minimax import best_move  # Import the best_move function from minimax.py
+import kinarow
+from ai_worker import AIWorker
+import solution_table
 from minimax import check_winner
+from minimax import enable_instrumentation
+from game import TicTacToe  # Game logic lives in a GUI-free module
 
-
-class TicTacToe:
-    def __init__(self):
-        self.board = [" " for _ in range(9)]  # 1D list representing 3x3 grid
-        self.current_winner = None  # Track winner
-        self.player_wins = 0  # Player wins counter
-        self.ai_wins = 0  # AI wins counter
-
-    def reset(self):
-        self.board = [" " for _ in range(9)]  # Reset the board
-        self.current_winner = None  # Reset the winner
-
-    def print_board(self):
-        # Print board for debugging purposes
-        for row in [
-            self.board[i * 3 : (i + 1) * 3] for i in range(3)
-        ]:  # Print the board
-            print("| " + " | ".join(row) + " |")  # Print the row
-
-    def available_moves(self):
-        return [
-            i for i, spot in enumerate(self.board) if spot == " "
-        ]  # Return a list of available moves
-
-    def make_move(self, square, letter):  # Make a move on the board
-        if self.board[square] == " ":  # Check if the move is valid
-            self.board[square] = letter  # Make the move
-            if self.winner(square, letter):  # Check if the move results in a win
-                self.current_winner = letter  # Update the winner
-            return True
-        return False
-
-    def winner(self, square, letter):  # Check if the move results in a win
-        # Check rows, columns, and diagonals for a win
-        row_ind = square // 3  # // is used for floor division
-        row = self.board[
-            row_ind * 3 : (row_ind + 1) * 3
-        ]  # row_ind*3 is the starting index of the row and (row_ind+1)*3 is the ending index of the row
-        if all(
-            [spot == letter for spot in row]
-        ):  # all() method returns True when all elements in the given iterable are true. If not, it returns False.
-            return True
-
-        col_ind = square % 3  # % is used for modulus division
-        column = [
-            self.board[col_ind + i * 3] for i in range(3)
-        ]  # col_ind+i*3 is the index of the column
-        if all([spot == letter for spot in column]):
-            return True
-
-        if square % 2 == 0:  # Check diagonals only if the square is an even number
-            diagonal1 = [self.board[i] for i in [0, 4, 8]]
-            if all([spot == letter for spot in diagonal1]):
-                return True
-            diagonal2 = [self.board[i] for i in [2, 4, 6]]
-            if all([spot == letter for spot in diagonal2]):
-                return True
-
-        return False
+AI_TIME_LIMIT = 0.05  # seconds the search engines may think per move
 
 
 class TicTacToeGUI:
-    def __init__(self, root):
-        self.game = TicTacToe()  # Create a TicTacToe object
+    def __init__(self, root, size=3, win_length=None, engine="minimax"):
+        self.size = size
+        if engine == "mcts":
+            import mcts  # Only this engine needs multiprocessing
+
+            self.game = kinarow.KInARowGame(size, win_length)
+            self.engine = functools.partial(
+                mcts.best_move,
+                player="O",
+                config=self.game.config,
+                iterations=None,
+                time_limit=AI_TIME_LIMIT,
+            )
+        elif size == 3 and win_length in (None, 3):
+            self.game = TicTacToe()  # Create a TicTacToe object
+            # Perfect-play table lookup, no search at runtime
+            self.engine = solution_table.best_move
+        else:
+            # Larger boards use the generalized engine, searching as deep as the
+            # time limit allows so the window never waits longer than that
+            self.game = kinarow.KInARowGame(size, win_length)
+            self.engine = functools.partial(
+                kinarow.best_move_timed,
+                player="O",
+                config=self.game.config,
+                time_limit=AI_TIME_LIMIT,
+            )
         self.root = root  # Create a root window
         # background color to the window
         self.root.configure(bg="lightyellow")  # Set the background color of the window
@@ -80,7 +53,7 @@ class TicTacToeGUI:
                 bg="lightgray",
                 command=lambda i=i: self.player_move(i),
             )
-            for i in range(9)
+            for i in range(size * size)
         ]
         self.create_board()
         # Add labels for displaying the win counters
@@ -90,7 +63,7 @@ class TicTacToeGUI:
             font="normal 15",
             bg="lightyellow",
         )
-        self.player_label.grid(row=3, column=0)
+        self.player_label.grid(row=size, column=0)
 
         self.ai_label = tk.Label(
             root,
@@ -98,7 +71,7 @@ class TicTacToeGUI:
             font="normal 15",
             bg="lightyellow",
         )
-        self.ai_label.grid(row=3, column=2)
+        self.ai_label.grid(row=size, column=size - 1)
 
         # Add a restart button
         self.restart_button = tk.Button(
@@ -108,18 +81,29 @@ class TicTacToeGUI:
             bg="lightblue",
             command=self.restart_game,
         )
-        self.restart_button.grid(row=4, column=1)
+        self.restart_button.grid(row=size + 1, column=size // 2)
+
+        # Searches run on a worker so the window stays responsive while the AI thinks
+        self.thinking_label = tk.Label(
+            root, text="", font="normal 12 italic", bg="lightyellow"
+        )
+        self.thinking_label.grid(row=size + 2, column=0, columnspan=size)
+        self.worker = AIWorker(root, indicator=self.thinking_label)
+        if self.engine is solution_table.best_move:
+            self.worker.warm_up(solution_table.load_table)  # builds it on first run
 
     def create_board(self):
         for i, button in enumerate(
             self.buttons
         ):  # enumerate() method adds a counter to an iterable and returns it in a form of enumerate object.
             row, col = divmod(
-                i, 3
+                i, self.size
             )  # divmod() method takes two numbers and returns a pair of numbers (a tuple) consisting of their quotient and remainder.
             button.grid(row=row, column=col)
 
     def player_move(self, i):  # Handle player move
+        if self.worker.busy():  # Wait for the AI to finish its move
+            return
         if self.game.board[i] == " ":  # Check if the move is valid
             self.buttons[i].config(text="X", fg="blue")  # Update the button label
             self.game.make_move(i, "X")  # Make the move on the board
@@ -131,7 +115,12 @@ class TicTacToeGUI:
                 self.ai_move()
 
     def ai_move(self):
-        move = best_move(self.game.board)  # Use the Minimax AI to find the best move
+        # Search on a copy of the board; finish_ai_move runs when the AI has chosen
+        self.worker.submit(self.engine, self.game.board[:], self.finish_ai_move)
+
+    def finish_ai_move(self, move):
+        if move is None:  # The player took the last square
+            return
         self.game.make_move(move, "O")  # Make the move on the board
         self.buttons[move].config(text="O", fg="red")  # Update the button label
         if self.game.current_winner:  # Check if the AI wins
@@ -154,10 +143,11 @@ class TicTacToeGUI:
             fg="green",
             bg="lightyellow",
         )
-        win_label.grid(row=3, column=1)
+        win_label.grid(row=self.size, column=self.size // 2)
 
     def restart_game(self):
-        # Reset the game board and internal state
+        # Drop any search still running, then reset the game board and internal state
+        self.worker.cancel()
         self.game.reset()
 
         # Reset the button labels to blank
@@ -166,6 +156,17 @@ class TicTacToeGUI:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play Tic Tac Toe against the AI")
+    parser.add_argument(
+        "--profile", metavar="PATH", help="append per-move search stats as JSON lines"
+    )
+    parser.add_argument("--size", type=int, default=3, help="board is size x size")
+    parser.add_argument("--win-length", type=int, default=None, help="K in a row")
+    parser.add_argument("--engine", choices=["minimax", "mcts"], default="minimax")
+    args = parser.parse_args()
+    if args.profile:
+        enable_instrumentation(profile_path=args.profile)
+
     root = tk.Tk()
-    game_gui = TicTacToeGUI(root)
+    game_gui = TicTacToeGUI(root, args.size, args.win_length, args.engine)
     root.mainloop()
@@ -0,0 +1,63 @@
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+POLL_MS = 16  # check for a finished move about 60 times a second
+
+
+class AIWorker:
+    # Runs AI move searches off the Tk main thread. Results come back through
+    # root.after on the main thread, so callbacks may touch widgets; a cancelled
+    # or superseded search still finishes in the background but its result is dropped.
+    def __init__(self, root, use_processes=False, indicator=None):
+        self.root = root
+        # A process keeps the GIL free for the GUI; the engine must then be picklable
+        if use_processes:
+            from concurrent.futures import ProcessPoolExecutor  # loads multiprocessing
+
+            self.executor = ProcessPoolExecutor(max_workers=1)
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        self.indicator = indicator  # optional tk.Label that shows "thinking"
+        self.generation = 0
+        self.future = None
+        self.frames = itertools.cycle(["Thinking" + "." * dots for dots in range(4)])
+
+    def warm_up(self, *tasks):
+        # Queue engine set-up (table loads, cache fills) ahead of the first search,
+        # so it runs while the window appears and never alongside a search
+        for task in tasks:
+            self.executor.submit(task)
+
+    def busy(self):
+        return self.future is not None
+
+    def submit(self, engine, board, on_done):
+        # Start engine(board) and call on_done(move) on the Tk thread when it finishes
+        self.cancel()
+        self.future = self.executor.submit(engine, board)
+        self.poll(self.future, self.generation, on_done)
+
+    def poll(self, future, generation, on_done):
+        if generation != self.generation:
+            return  # cancelled
+        if not future.done():
+            if self.indicator is not None:
+                self.indicator.config(text=next(self.frames))
+            self.root.after(POLL_MS, self.poll, future, generation, on_done)
+            return
+        self.future = None
+        if self.indicator is not None:
+            self.indicator.config(text="")
+        on_done(future.result())
+
+    def cancel(self):
+        self.generation += 1
+        if self.future is not None:
+            self.future.cancel()  # only stops a search that has not started yet
+            self.future = None
+        if self.indicator is not None:
+            self.indicator.config(text="")
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,323 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import minimax
+import solution_table
+from bitboard import BitBoard
+from game import TicTacToe
+from trainer import Trainer
+
+BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json"
+)
+
+# Canonical positions: empty board, after 1 ply and after 2 plies
+POSITIONS = {
+    "empty": [" "] * 9,
+    "1ply": [" ", " ", " ", " ", "X", " ", " ", " ", " "],
+    "2ply": ["X", " ", " ", " ", "O", " ", " ", " ", " "],
+}
+MIDGAME = ["X", "O", " ", " ", "X", " ", " ", " ", "O"]
+# Modules launched as programs; their import time is what a user waits for. These
+# subprocess timings swing too much to gate on, so they are only reported.
+UNGATED_PREFIXES = ("import[", "first_move[")
+STARTUP_MODULES = [
+    "UserVsMinimax",
+    "DualGame",
+    "QLearnGUI",
+    "1v1GUIDrawReward",
+    "DynamicGUI",
+    "trainer",
+]
+
+
+def time_per_call(func, min_time=0.1, repeat=5):
+    # Best-of-repeat seconds per call, with enough calls per run to fill min_time
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def engine_benchmarks():
+    results = {}
+    table = solution_table.load_table()
+    for name, board in POSITIONS.items():
+        results[f"minimax.best_move[{name},cold]"] = time_per_call(
+            lambda: minimax.best_move(board[:], table=None), min_time=0, repeat=1
+        )
+        results[f"minimax.best_move[{name},cached]"] = time_per_call(
+            lambda: minimax.best_move(board[:])
+        )
+        results[f"minimax.best_move_alphabeta[{name},cold]"] = time_per_call(
+            lambda: minimax.best_move_alphabeta(board[:], table=None)
+        )
+        results[f"solution_table.best_move[{name}]"] = time_per_call(
+            lambda: table.best_move(board)
+        )
+    # Whole-batch query, reported per position
+    batch = [board for board in POSITIONS.values() for _ in range(100)] + [MIDGAME]
+    results["solution_table.best_moves[batch]"] = time_per_call(
+        lambda: solution_table.best_moves(batch, table)
+    ) / len(batch)
+    return results
+
+
+def list_scan_winner(board, square, letter):
+    # Reference: the list-scanning TicTacToe.check_winner the games used before the
+    # incremental line counts, kept so the two can be compared
+    row_ind = square // 3
+    row = board[row_ind * 3 : (row_ind + 1) * 3]
+    if all([spot == letter for spot in row]):
+        return True
+
+    col_ind = square % 3
+    column = [board[col_ind + i * 3] for i in range(3)]
+    if all([spot == letter for spot in column]):
+        return True
+
+    if square % 2 == 0:
+        diagonal1 = [board[i] for i in [0, 4, 8]]
+        if all([spot == letter for spot in diagonal1]):
+            return True
+        diagonal2 = [board[i] for i in [2, 4, 6]]
+        if all([spot == letter for spot in diagonal2]):
+            return True
+
+    return False
+
+
+def winner_benchmarks():
+    results = {}
+    results["minimax.check_winner[list]"] = time_per_call(
+        lambda: minimax.check_winner(MIDGAME)
+    )
+    bitboard = BitBoard.from_list(MIDGAME)
+    results["minimax.check_winner[bitboard]"] = time_per_call(
+        lambda: minimax.check_winner(bitboard)
+    )
+    results["list_scan_winner"] = time_per_call(
+        lambda: list_scan_winner(MIDGAME, 4, "X")
+    )
+    game = TicTacToe()
+    for square, letter in enumerate(MIDGAME):
+        if letter != " ":
+            game.make_move(square, letter)
+    results["TicTacToe.winner"] = time_per_call(lambda: game.winner(4, "X"))
+    return results
+
+
+def make_agents():
+    from QlearnerAI import QLearningAI
+    from DynamicQlearner import QLearningAI as DynamicQLearningAI
+    from QLearnerAIDraw import QLearningAI as DrawQLearningAI
+
+    return {
+        "QlearnerAI": QLearningAI(),
+        "DynamicQlearner": DynamicQLearningAI(),
+        "QLearnerAIDraw": DrawQLearningAI(),
+    }
+
+
+def agent_benchmarks():
+    results = {}
+    state = MIDGAME
+    moves = [i for i, spot in enumerate(state) if spot == " "]
+    next_state = state[:]
+    next_state[moves[0]] = "X"
+    next_moves = moves[1:]
+    for name, q_ai in make_agents().items():
+        # Warm the table with some training so lookups hit populated entries
+        random.seed(0)
+        Trainer(q_ai).train(200)
+        results[f"{name}.choose_action"] = time_per_call(
+            lambda: q_ai.choose_action(state, moves)
+        )
+        results[f"{name}.update_q_table"] = time_per_call(
+            lambda: q_ai.update_q_table(state, moves[0], 0, next_state, next_moves)
+        )
+    return results
+
+
+def game_benchmarks(games=1000, repeat=5):
+    # Best of repeat fresh, identically seeded training runs per agent
+    results = {}
+    for name in make_agents():
+        best = None
+        for _ in range(repeat):
+            random.seed(0)
+            trainer = Trainer(make_agents()[name])
+            trainer.train(games)
+            # Stored as seconds per game so that lower is better everywhere
+            seconds = trainer.elapsed / games
+            best = seconds if best is None else min(best, seconds)
+        results[f"games[{name} vs minimax]"] = best
+    return results
+
+
+def fresh_interpreter_seconds(code, repeat=3):
+    # Best-of-repeat time printed by code run in a new interpreter, so nothing is
+    # already imported or cached
+    here = os.path.dirname(os.path.abspath(__file__))
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=here,
+        ).stdout
+        runs.append(float(output))
+    return min(runs)
+
+
+def startup_benchmarks():
+    results = {}
+    for module in STARTUP_MODULES:
+        results[f"import[{module}]"] = fresh_interpreter_seconds(
+            "import importlib, time\n"
+            "start = time.perf_counter()\n"
+            f"importlib.import_module({module!r})\n"
+            "print(time.perf_counter() - start)"
+        )
+    # Import plus the AI's first reply, as in the first click of UserVsMinimax
+    results["first_move[UserVsMinimax]"] = fresh_interpreter_seconds(
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import UserVsMinimax\n"
+        "board = [' ', ' ', ' ', ' ', 'X', ' ', ' ', ' ', ' ']\n"
+        "UserVsMinimax.solution_table.best_move(board)\n"
+        "print(time.perf_counter() - start)"
+    )
+    return results
+
+
+def run_once():
+    results = {}
+    results.update(engine_benchmarks())
+    results.update(winner_benchmarks())
+    results.update(agent_benchmarks())
+    results.update(game_benchmarks())
+    return results
+
+
+def run_all(rounds=3):
+    # Best of several full rounds, plus each row's spread (slowest / fastest round)
+    # as a measure of how noisy this machine is for it right now
+    runs = [run_once() for _ in range(rounds)]
+    results = {name: min(run[name] for run in runs) for name in runs[0]}
+    spread = {name: max(run[name] for run in runs) / results[name] for name in results}
+    results.update(startup_benchmarks())
+    return results, spread
+
+
+def host_info():
+    # Timings are only comparable between runs on the same kind of host
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(results, baseline, threshold, spread=None, gate=True):
+    # Ratio > 1 means slower than the baseline; returns the regressed names. A row
+    # only regresses when it is slower by more than threshold on top of its own
+    # round-to-round spread. Startup rows, and everything when gate is off, are
+    # reported but never fail.
+    spread = spread or {}
+    regressions = []
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:48} {seconds * 1e6:12.2f} us  (new)")
+            continue
+        ratio = seconds / base
+        limit = (1 + threshold) * spread.get(name, 1.0)
+        gated = gate and not name.startswith(UNGATED_PREFIXES)
+        if ratio > limit:
+            verdict = "REGRESSION" if gated else "slower (not gated)"
+            if gated:
+                regressions.append(name)
+        elif ratio < 1 - threshold:
+            verdict = "faster"
+        else:
+            verdict = ""
+        print(
+            f"{name:48} {seconds * 1e6:12.2f} us  {ratio:6.2f}x  "
+            f"(limit {limit:.2f}x)  {verdict}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark engines, learners and games")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--output", default=None, help="also write results as JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.5, help="allowed slowdown (0.5 = 50%%)"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=3, help="best of this many full rounds"
+    )
+    args = parser.parse_args()
+
+    results, spread = run_all(args.rounds)
+    report = {"host": host_info(), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    baseline, gate = {}, True
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            saved = json.load(f)
+        baseline = saved["results"]
+        if saved.get("host") != report["host"]:
+            # Another machine's absolute numbers say nothing about this one
+            print("Baseline was recorded on a different host; ratios are for reference")
+            print("only. Run with --save-baseline to gate against this machine.")
+            gate = False
+    regressions = compare(results, baseline, args.threshold, spread, gate)
+    if regressions:
+        # Confirm before failing: re-measure and keep each row's best of both runs
+        print(f"Re-measuring to confirm {len(regressions)} regression(s)")
+        again, again_spread = run_all(args.rounds)
+        confirm = {name: min(results[name], again[name]) for name in regressions}
+        spread = {name: max(spread[name], again_spread[name]) for name in regressions}
+        regressions = compare(confirm, baseline, args.threshold, spread, gate)
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
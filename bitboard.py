@@ -0,0 +1,137 @@
+# Bitboard game core: one 9-bit integer per player, bit i set when that player holds square i
+LINES = [
+    (0, 1, 2),
+    (3, 4, 5),
+    (6, 7, 8),  # rows
+    (0, 3, 6),
+    (1, 4, 7),
+    (2, 5, 8),  # columns
+    (0, 4, 8),
+    (2, 4, 6),  # diagonals
+]
+LINE_MASKS = tuple(sum(1 << i for i in line) for line in LINES)
+FULL_MASK = 0x1FF
+SQUARE_BITS = tuple(1 << i for i in range(9))
+
+# WIN_TABLE[bits] is True when the squares in bits contain a complete line
+WIN_TABLE = tuple(
+    any(bits & mask == mask for mask in LINE_MASKS) for bits in range(512)
+)
+# LINES_THROUGH[square] lists the indexes (into LINES) of the lines through square
+LINES_THROUGH = tuple(
+    tuple(index for index, line in enumerate(LINES) if square in line)
+    for square in range(9)
+)
+# MASK_SQUARES[bits] lists the squares set in bits, in ascending order
+MASK_SQUARES = tuple(
+    tuple(i for i in range(9) if bits & SQUARE_BITS[i]) for bits in range(512)
+)
+
+
+# (x, o) -> board as a tuple of " "/"X"/"O", shared so state copies cost one lookup
+_state_tuples = {}
+
+
+class BitBoard:
+    __slots__ = ("x", "o")
+
+    def __init__(self, x=0, o=0):
+        self.x = x
+        self.o = o
+
+    @classmethod
+    def from_list(cls, board):
+        bitboard = cls()
+        for i, spot in enumerate(board):
+            if spot != " ":
+                bitboard.make_move(i, spot)
+        return bitboard
+
+    def to_list(self):
+        return [self.letter_at(i) for i in range(9)]
+
+    def as_tuple(self):
+        key = self.x << 9 | self.o
+        state = _state_tuples.get(key)
+        if state is None:
+            state = _state_tuples[key] = tuple(self.to_list())
+        return state
+
+    def copy(self):
+        return type(self)(self.x, self.o)
+
+    def letter_at(self, square):
+        bit = SQUARE_BITS[square]
+        if self.x & bit:
+            return "X"
+        if self.o & bit:
+            return "O"
+        return " "
+
+    def legal_mask(self):
+        return FULL_MASK & ~(self.x | self.o)
+
+    def legal_moves(self):
+        return list(MASK_SQUARES[self.legal_mask()])
+
+    def make_move(self, square, letter):
+        if letter == "X":
+            self.x |= SQUARE_BITS[square]
+        else:
+            self.o |= SQUARE_BITS[square]
+
+    def unmake_move(self, square, letter):
+        if letter == "X":
+            self.x &= ~SQUARE_BITS[square]
+        else:
+            self.o &= ~SQUARE_BITS[square]
+
+    def is_win(self, letter):
+        return WIN_TABLE[self.x if letter == "X" else self.o]
+
+    def winner(self):
+        # Same results as minimax.check_winner: "X", "O", "tie" or None
+        if WIN_TABLE[self.x]:
+            return "X"
+        if WIN_TABLE[self.o]:
+            return "O"
+        if self.x | self.o == FULL_MASK:
+            return "tie"
+        return None
+
+
+class BoardAdapter(BitBoard):
+    # List-of-strings view of a BitBoard, so code written for the 9-element
+    # " "/"X"/"O" list (the GUIs, best_move, check_winner) runs on the bitboard
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        return self.letter_at(index)
+
+    def __setitem__(self, index, letter):
+        bit = SQUARE_BITS[index]
+        self.x &= ~bit
+        self.o &= ~bit
+        if letter != " ":
+            self.make_move(index, letter)
+
+    def __len__(self):
+        return 9
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __contains__(self, letter):
+        if letter == " ":
+            return self.legal_mask() != 0
+        return (self.x if letter == "X" else self.o) != 0
+
+    def count(self, letter):
+        if letter == " ":
+            return len(MASK_SQUARES[self.legal_mask()])
+        return len(MASK_SQUARES[self.x if letter == "X" else self.o])
+
+    def __repr__(self):
+        return f"BoardAdapter({self.to_list()!r})"
@@ -0,0 +1,152 @@
+import json
+import mmap
+import os
+import queue
+import struct
+import threading
+from solution_table import position_index
+
+# Binary Q-table checkpoint, little-endian:
+#   header   magic, version, reserved, metadata length, entry count
+#   metadata JSON of the agent's scalar settings (trial_count, alpha, ...),
+#            zero-padded to a multiple of 8 bytes
+#   values   float64[count]
+#   states   uint16[count]  base-3 position code of each state
+#   actions  uint8[count]
+MAGIC = b"TTTQ"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+LETTERS = " XO"
+
+
+def decode_state(code):
+    return tuple(LETTERS[code // 3**i % 3] for i in range(9))
+
+
+def agent_metadata(q_ai):
+    # Scalar attributes are everything needed to resume the agent's schedules
+    settings = {
+        name: value
+        for name, value in vars(q_ai).items()
+        if isinstance(value, (bool, int, float))
+    }
+    return {"class": type(q_ai).__module__ + "." + type(q_ai).__name__, **settings}
+
+
+def snapshot(q_ai):
+    # Consistent copy taken on the training thread; encoding can happen elsewhere
+    return agent_metadata(q_ai), q_ai.q_table.copy()
+
+
+def write_snapshot(path, metadata, q_table):
+    entries = list(q_table.items())
+    meta_bytes = json.dumps(metadata).encode()
+    meta_bytes += b"\0" * (-len(meta_bytes) % 8)
+    count = len(entries)
+
+    # Write to a temporary file first so a crash never leaves a torn checkpoint
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(meta_bytes), count))
+        f.write(meta_bytes)
+        f.write(struct.pack(f"<{count}d", *(value for _, value in entries)))
+        codes = (position_index(state) for (state, _), _ in entries)
+        f.write(struct.pack(f"<{count}H", *codes))
+        f.write(struct.pack(f"<{count}B", *(action for (_, action), _ in entries)))
+    os.replace(temp_path, path)
+
+
+def save_checkpoint(q_ai, path):
+    write_snapshot(path, *snapshot(q_ai))
+
+
+def load_checkpoint(q_ai, path):
+    # Restore the Q-table and scalar settings (including DynamicQlearner's
+    # trial_count, which drives its alpha/gamma/epsilon schedules) into q_ai
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        magic, version, _, meta_length, count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} Q-table checkpoint")
+        offset = HEADER.size
+        meta_bytes = bytes(data[offset : offset + meta_length])
+        metadata = json.loads(meta_bytes.rstrip(b"\0"))
+        offset += meta_length
+        values = struct.unpack_from(f"<{count}d", data, offset)
+        offset += 8 * count
+        states = struct.unpack_from(f"<{count}H", data, offset)
+        offset += 2 * count
+        actions = struct.unpack_from(f"<{count}B", data, offset)
+    finally:
+        data.close()
+
+    expected = type(q_ai).__module__ + "." + type(q_ai).__name__
+    if metadata.pop("class") != expected:
+        raise ValueError(f"{path} holds a different agent type than {expected}")
+    if metadata.get("canonical", False) != getattr(q_ai, "canonical", False):
+        raise ValueError(f"{path} was saved with a different canonical setting")
+    metadata.pop("dense", None)  # the table backend is chosen by the caller
+    for name, value in metadata.items():
+        setattr(q_ai, name, value)
+
+    decoded = {}
+    for value, code, action in zip(values, states, actions):
+        state = decoded.get(code)
+        if state is None:
+            state = decoded[code] = decode_state(code)
+        q_ai.q_table[(state, action)] = value
+    return q_ai
+
+
+class CheckpointWriter:
+    # Periodic checkpoints written on a background thread. The training thread
+    # only takes a snapshot; if the writer is still busy the older pending
+    # snapshot is replaced, so training never waits on disk I/O.
+    def __init__(self, q_ai, path, every=1000):
+        self.q_ai = q_ai
+        self.path = path
+        self.every = every
+        self.saved = 0
+        self.error = None  # last failed write, reported but not fatal
+        self.pending = queue.Queue(maxsize=1)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            try:
+                write_snapshot(self.path, *item)
+            except Exception as error:
+                # Keep the writer alive so close() and later snapshots never hang
+                self.error = error
+                print(f"Checkpoint write to {self.path} failed: {error}")
+                continue
+            self.saved += 1
+
+    def submit(self):
+        item = snapshot(self.q_ai)
+        while True:
+            try:
+                self.pending.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.pending.get_nowait()  # drop the stale snapshot
+                except queue.Empty:
+                    pass
+
+    def maybe_save(self, games_played):
+        if self.every and games_played % self.every == 0:
+            self.submit()
+
+    def close(self):
+        # Write a final checkpoint and wait for the writer to finish
+        if not self.thread.is_alive():
+            return
+        self.submit()
+        self.pending.put(None)
+        self.thread.join()
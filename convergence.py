@@ -0,0 +1,64 @@
+class ConvergenceMonitor:
+    # Early stopping for training runs. Every `window` games the Q-table is compared
+    # with the copy taken one window earlier; the run has converged once no greedy
+    # action changed and no Q-value moved by more than `threshold` in between.
+    def __init__(self, q_ai, window=500, threshold=1e-3):
+        self.q_ai = q_ai
+        self.window = window
+        self.threshold = threshold
+        self.converged_at = None  # games played when convergence was detected
+        self.max_delta = None  # largest |dQ| over the last completed window
+        self.policy_changes = None  # states whose greedy actions changed
+        self.previous = None
+        self.previous_policy = None
+
+    def update(self, games_played):
+        # Call after each game; returns True once the run has converged
+        if self.converged_at is not None:
+            return True
+        if games_played % self.window:
+            return False
+        q_table = self.q_ai.q_table.copy()
+        policy = greedy_policy(q_table)
+        if self.previous is not None:
+            self.max_delta = max_delta(self.previous, q_table)
+            self.policy_changes = sum(
+                policy.get(state) != actions
+                for state, actions in self.previous_policy.items()
+            ) + len(policy.keys() - self.previous_policy.keys())
+            if not self.policy_changes and self.max_delta < self.threshold:
+                self.converged_at = games_played
+        self.previous, self.previous_policy = q_table, policy
+        return self.converged_at is not None
+
+
+def greedy_policy(q_table):
+    # state -> tuple of its best actions (unstored legal moves count as 0)
+    if hasattr(q_table, "visited"):
+        return dense_greedy_policy(q_table)
+    rows = {}
+    for (state, action), q in q_table.items():
+        rows.setdefault(state, {})[action] = q
+    policy = {}
+    for state, row in rows.items():
+        values = {move: row.get(move, 0.0) for move in range(9) if state[move] == " "}
+        best = max(values.values())
+        policy[state] = tuple(move for move, q in values.items() if q == best)
+    return policy
+
+
+def dense_greedy_policy(table):
+    import numpy as np
+
+    rows = np.flatnonzero(table.visited.any(axis=1))
+    values = np.where(table.legal[rows], table.values[rows], -np.inf)
+    best = values == values.max(axis=1, keepdims=True)
+    return {int(row): mask.tobytes() for row, mask in zip(rows, best)}
+
+
+def max_delta(before, after):
+    if hasattr(after, "visited"):
+        return float(abs(after.values - before.values).max())
+    return max(
+        (abs(q - before.get(key, 0.0)) for key, q in after.items()), default=0.0
+    )
@@ -0,0 +1,133 @@
+import numpy as np
+from minimax import check_winner
+from solution_table import NUM_POSITIONS, position_index
+
+_ranking = None
+_rows = {}  # state tuple -> (row or -1, legal-move bits), each board encoded once
+
+
+def legal_positions():
+    # Ranking of every reachable position (X moves first, terminal ones included):
+    # rank[base-3 code] is a dense row index or -1, and legal[row] masks the empty
+    # squares of non-terminal positions
+    global _ranking
+    if _ranking is None:
+        codes = {}
+        stack = [[" "] * 9]
+        while stack:
+            board = stack.pop()
+            code = position_index(board)
+            if code in codes:
+                continue
+            codes[code] = board
+            if check_winner(board):
+                continue
+            player = "X" if board.count("X") == board.count("O") else "O"
+            for i in range(9):
+                if board[i] == " ":
+                    child = board[:]
+                    child[i] = player
+                    stack.append(child)
+
+        rank = np.full(NUM_POSITIONS, -1, dtype=np.int32)
+        legal = np.zeros((len(codes), 9), dtype=bool)
+        for row, code in enumerate(sorted(codes)):
+            rank[code] = row
+            board = codes[code]
+            if not check_winner(board):
+                legal[row] = [spot == " " for spot in board]
+        _ranking = (rank, legal)
+    return _ranking
+
+
+class DenseQTable:
+    # Q-values for all legal positions in one contiguous float32 (positions x 9) array.
+    # Also answers the dict interface used by the QLearningAI classes, with keys
+    # (state, action); values for occupied squares and illegal positions are masked.
+    def __init__(self):
+        self.rank, self.legal = legal_positions()
+        self.values = np.zeros(self.legal.shape, dtype=np.float32)
+        self.visited = np.zeros(self.legal.shape, dtype=bool)
+
+    def lookup(self, state):
+        # (row or -1, 9-bit mask of legal moves), cached for state tuples only:
+        # lists and (mutable, identity-hashed) bitboards are encoded every time
+        if type(state) is not tuple:
+            return self.encode(state)
+        entry = _rows.get(state)
+        if entry is None:
+            entry = _rows[state] = self.encode(state)
+        return entry
+
+    def encode(self, state):
+        row = int(self.rank[position_index(state)])
+        if row < 0:
+            return row, 0
+        return row, sum(1 << i for i in range(9) if self.legal[row, i])
+
+    def index(self, state):
+        row = self.lookup(state)[0]
+        if row < 0:
+            raise KeyError(f"not a legal position: {list(state)}")
+        return row
+
+    def row(self, state):
+        # Writable view of the 9 Q-values of a position
+        return self.values[self.index(state)]
+
+    def max_value(self, state):
+        # Highest Q-value over the legal moves of state (0 if there are none)
+        row = self.index(state)
+        legal = self.legal[row]
+        return float(self.values[row][legal].max()) if legal.any() else 0.0
+
+    def get(self, key, default=0.0):
+        state, action = key
+        row, legal = self.lookup(state)
+        if not legal >> action & 1:
+            return default
+        return self.values.item(row, action)
+
+    def __getitem__(self, key):
+        state, action = key
+        row = self.index(state)
+        if not self.visited[row, action]:
+            raise KeyError(key)
+        return self.values.item(row, action)
+
+    def __setitem__(self, key, value):
+        state, action = key
+        row, legal = self.lookup(state)
+        if not legal >> action & 1:
+            raise KeyError(f"square {action} is not a legal move in {list(state)}")
+        self.values[row, action] = value
+        self.visited[row, action] = True
+
+    def __contains__(self, key):
+        state, action = key
+        row = self.lookup(state)[0]
+        return row >= 0 and bool(self.visited[row, action])
+
+    def __len__(self):
+        return int(self.visited.sum())
+
+    def copy(self):
+        table = DenseQTable()
+        table.values[:] = self.values
+        table.visited[:] = self.visited
+        return table
+
+    def items(self):
+        codes = np.flatnonzero(self.rank >= 0)
+        for row, action in zip(*np.nonzero(self.visited)):
+            code = int(codes[row])
+            state = tuple(" XO"[code // 3**i % 3] for i in range(9))
+            yield (state, int(action)), float(self.values[row, action])
+
+    def memory_bytes(self):
+        return (
+            self.values.nbytes
+            + self.visited.nbytes
+            + self.legal.nbytes
+            + self.rank.nbytes
+        )
@@ -0,0 +1,146 @@
+import argparse
+import random
+from multiprocessing import Pool
+from minimax import check_winner
+
+OPPONENT = {"X": "O", "O": "X"}
+
+
+def greedy_move(q_ai, state, available_moves):
+    # Frozen greedy choice: highest Q-value, ties broken by the lowest square
+    state_key = getattr(q_ai, "state_key", lambda s, a: (tuple(s), a))
+    return max(
+        available_moves,
+        key=lambda move: (q_ai.q_table.get(state_key(state, move), 0), -move),
+    )
+
+
+def freeze_policy(q_ai, player="X"):
+    # Greedy move for every position the policy can reach against any opponent
+    policy = {}
+    stack = [([" "] * 9, "X")]
+    while stack:
+        board, to_move = stack.pop()
+        if check_winner(board):
+            continue
+        if to_move == player:
+            state = tuple(board)
+            if state in policy:
+                continue
+            available_moves = [i for i in range(9) if board[i] == " "]
+            policy[state] = greedy_move(q_ai, board, available_moves)
+            moves = [policy[state]]
+        else:
+            moves = [i for i in range(9) if board[i] == " "]
+        for move in moves:
+            child = board[:]
+            child[move] = to_move
+            stack.append((child, OPPONENT[to_move]))
+    return policy
+
+
+def evaluate_line(policy, player, board, to_move, line, result):
+    # Worst-case value for player (1 win, 0 draw, -1 loss) below this position,
+    # recording the outcome of every complete line in result
+    winner = check_winner(board)
+    if winner:
+        if winner == "tie":
+            result["draw"] += 1
+            return 0
+        if winner == player:
+            result["win"] += 1
+            return 1
+        result["loss"] += 1
+        result["losing_lines"].append(line)
+        return -1
+
+    if to_move == player:
+        moves = [policy[tuple(board)]]
+    else:
+        moves = [i for i in range(9) if board[i] == " "]
+    worst = 1
+    for move in moves:
+        board[move] = to_move
+        value = evaluate_line(
+            policy, player, board, OPPONENT[to_move], line + [move], result
+        )
+        board[move] = " "
+        worst = min(worst, value)
+    return worst
+
+
+def evaluate_opening(args):
+    # Worker task: every line that starts with the given opening moves
+    policy, player, opening = args
+    board = [" "] * 9
+    to_move = "X"
+    for move in opening:
+        board[move] = to_move
+        to_move = OPPONENT[to_move]
+    result = {"win": 0, "draw": 0, "loss": 0, "losing_lines": []}
+    result["value"] = evaluate_line(
+        policy, player, board, to_move, list(opening), result
+    )
+    return result
+
+
+def split_openings(policy, player):
+    # Split on the opponent's first move (after the policy's opening when it plays X)
+    if player == "X":
+        first = policy[(" ",) * 9]
+        return [(first, i) for i in range(9) if i != first]
+    return [(i,) for i in range(9)]
+
+
+def exploitability(q_ai, player="X", workers=1):
+    policy = freeze_policy(q_ai, player)
+    tasks = [(policy, player, opening) for opening in split_openings(policy, player)]
+    if workers > 1:
+        with Pool(workers) as pool:
+            results = pool.map(evaluate_opening, tasks)
+    else:
+        results = [evaluate_opening(task) for task in tasks]
+
+    report = {
+        "value": min(result["value"] for result in results),  # guaranteed result
+        "win": sum(result["win"] for result in results),
+        "draw": sum(result["draw"] for result in results),
+        "loss": sum(result["loss"] for result in results),
+        "losing_lines": [
+            line for result in results for line in result["losing_lines"]
+        ],
+        "positions": len(policy),
+    }
+    return report
+
+
+def main():
+    from trainer import Trainer, make_agent
+
+    parser = argparse.ArgumentParser(
+        description="Train a Q AI, then check its greedy policy against every line"
+    )
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--agent", choices=["qlearner", "dynamic"], default="qlearner")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    trainer = Trainer(make_agent(args.agent))
+    trainer.train(args.games)
+    report = exploitability(trainer.q_ai, workers=args.workers)
+
+    outcome = {1: "win", 0: "draw", -1: "loss"}[report["value"]]
+    print(f"Worst case: {outcome} ({report['positions']} policy positions)")
+    print(
+        f"Lines: {report['win']} wins | {report['draw']} draws | "
+        f"{report['loss']} losses"
+    )
+    for line in report["losing_lines"]:
+        print("Losing line: " + " ".join(str(move) for move in line))
+
+
+if __name__ == "__main__":
+    main()
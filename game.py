@@ -0,0 +1,80 @@
+from bitboard import LINES, LINES_THROUGH, BoardAdapter
+
+
+class TicTacToe:
+    def __init__(self):
+        self.player_wins = 0  # Player wins counter
+        self.ai_wins = 0  # AI wins counter
+        self.reset()
+
+    def reset(self):
+        self.board = BoardAdapter()  # Bitboard with a 1D list view of the 3x3 grid
+        self.current_winner = None  # Track winner
+        # Pieces each player has on every row, column and diagonal (see LINES)
+        self.line_counts = {"X": [0] * len(LINES), "O": [0] * len(LINES)}
+        self.free = set(range(9))  # Empty squares
+        self.history = []  # (square, letter, winner before the move) for unmake_move
+
+    def print_board(self):
+        # Print board for debugging purposes
+        for row in [
+            self.board[i * 3 : (i + 1) * 3] for i in range(3)
+        ]:  # Print the board
+            print("| " + " | ".join(row) + " |")  # Print the row
+
+    def state(self):
+        return self.board.as_tuple()  # Shared tuple of the board, no list copy
+
+    def available_moves(self):
+        return self.board.legal_moves()  # Return a list of available moves
+
+    def is_draw(self):
+        return not self.free and self.current_winner is None
+
+    def is_over(self):
+        return self.current_winner is not None or not self.free
+
+    def make_move(self, square, letter):  # Make a move on the board
+        if square in self.free:  # Check if the move is valid
+            self.history.append((square, letter, self.current_winner))
+            self.board.make_move(square, letter)  # Make the move
+            self.free.discard(square)
+            counts = self.line_counts[letter]
+            completed = False
+            for line in LINES_THROUGH[square]:  # Only these lines can change
+                counts[line] += 1
+                if counts[line] == 3:
+                    completed = True
+            if completed and self.current_winner is None:
+                self.current_winner = letter  # Update the winner
+            return True
+        return False
+
+    def unmake_move(self):  # Take back the last move, so search can walk in place
+        square, letter, previous_winner = self.history.pop()
+        self.board.unmake_move(square, letter)
+        self.free.add(square)
+        counts = self.line_counts[letter]
+        for line in LINES_THROUGH[square]:
+            counts[line] -= 1
+        self.current_winner = previous_winner
+        return square
+
+    def winner(self, square, letter):  # Check if the move results in a win
+        # The letter's squares form a 9-bit mask; a 512-entry table says whether
+        # that mask contains a complete row, column or diagonal
+        return self.board.is_win(letter)
+
+    check_winner = winner  # Name used by the training GUIs' game classes
+
+    def sync(self):
+        # Rebuild the counters after the board was written to directly
+        self.line_counts = {
+            letter: [sum(self.board[i] == letter for i in line) for line in LINES]
+            for letter in ("X", "O")
+        }
+        self.free = set(self.board.legal_moves())
+        self.history = []
+        self.current_winner = next(
+            (letter for letter in ("X", "O") if 3 in self.line_counts[letter]), None
+        )
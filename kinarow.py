@@ -0,0 +1,269 @@
+import functools
+import math
+import time
+import minimax
+
+# Generalized N x N board with K in a row to win. Boards are lists of " "/"X"/"O"
+# of length N * N (row-major, like the 3x3 boards); the search runs on bitboards
+# with bit i set when a player holds square i.
+
+WIN_SCORE = 1_000_000
+OPPONENT = {"X": "O", "O": "X"}
+
+
+class BoardConfig:
+    def __init__(self, size=3, win_length=3):
+        if not 1 <= win_length <= size:
+            raise ValueError("win_length must be between 1 and the board size")
+        self.size = size
+        self.win_length = win_length
+        self.squares = size * size
+        self.full_mask = (1 << self.squares) - 1
+
+        # Every run of win_length squares: rows, columns and both diagonals
+        self.lines = []
+        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]
+        for row in range(size):
+            for col in range(size):
+                for d_row, d_col in directions:
+                    end_row = row + d_row * (win_length - 1)
+                    end_col = col + d_col * (win_length - 1)
+                    if 0 <= end_row < size and 0 <= end_col < size:
+                        self.lines.append(
+                            tuple(
+                                (row + d_row * i) * size + col + d_col * i
+                                for i in range(win_length)
+                            )
+                        )
+        self.line_masks = [sum(1 << i for i in line) for line in self.lines]
+        # Only the lines through the last move can have just been completed
+        self.masks_through = [
+            [mask for mask in self.line_masks if mask >> square & 1]
+            for square in range(self.squares)
+        ]
+        # Squares touching each square, to keep the search near the action
+        self.neighbors = []
+        for square in range(self.squares):
+            row, col = divmod(square, size)
+            mask = 0
+            for d_row in (-1, 0, 1):
+                for d_col in (-1, 0, 1):
+                    r, c = row + d_row, col + d_col
+                    if (d_row or d_col) and 0 <= r < size and 0 <= c < size:
+                        mask |= 1 << (r * size + c)
+            self.neighbors.append(mask)
+        # Center squares first: they lie on the most lines
+        center = (size - 1) / 2
+        self.move_order = sorted(
+            range(self.squares),
+            key=lambda s: (abs(s // size - center) + abs(s % size - center), s),
+        )
+        # Line-threat weights: a line with k of one player's pieces and none of
+        # the other's is worth 10^k to that player
+        self.weights = [0] + [10**k for k in range(1, win_length + 1)]
+        # Full search on 3x3, otherwise a depth that answers in well under a second
+        self.default_depth = self.squares if self.squares <= 9 else 4
+
+    def wins(self, bits, square):
+        for mask in self.masks_through[square]:
+            if bits & mask == mask:
+                return True
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def get_config(size=3, win_length=None):
+    # Shared, precomputed configuration; win_length defaults to the size (at most 5)
+    return BoardConfig(size, win_length or min(size, 5))
+
+
+def config_for(board, win_length=None):
+    return get_config(math.isqrt(len(board)), win_length)
+
+
+def to_bits(board):
+    x = o = 0
+    for i, spot in enumerate(board):
+        if spot == "X":
+            x |= 1 << i
+        elif spot == "O":
+            o |= 1 << i
+    return x, o
+
+
+def check_winner(board, config=None):
+    # Same results as minimax.check_winner, for any board configuration
+    config = config or config_for(board)
+    x, o = to_bits(board)
+    for mask in config.line_masks:
+        if x & mask == mask:
+            return "X"
+        if o & mask == mask:
+            return "O"
+    if " " not in board:
+        return "tie"
+    return None
+
+
+def evaluate(config, mine, theirs):
+    # Line-threat heuristic from the point of view of the side to move
+    score = 0
+    weights = config.weights
+    for mask in config.line_masks:
+        own = mine & mask
+        other = theirs & mask
+        if own and not other:
+            score += weights[own.bit_count()]
+        elif other and not own:
+            score -= weights[other.bit_count()]
+    return score
+
+
+def candidate_moves(config, mine, theirs, first=None):
+    # Empty squares in center-first order; on larger boards only those next to a piece
+    occupied = mine | theirs
+    empty = config.full_mask & ~occupied
+    if occupied and config.squares > 9:
+        near = 0
+        for square in range(config.squares):
+            if occupied >> square & 1:
+                near |= config.neighbors[square]
+        empty &= near
+    moves = [s for s in config.move_order if empty >> s & 1 and s != first]
+    if first is not None and empty >> first & 1:
+        moves.insert(0, first)
+    return moves
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class SearchBudget:
+    # Wall-clock and/or node budget shared by one iterative-deepening search
+    def __init__(self, time_limit=None, node_limit=None):
+        self.deadline = time.perf_counter() + time_limit if time_limit else None
+        self.node_limit = node_limit
+        self.nodes = 0
+
+    def tick(self):
+        self.nodes += 1
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            raise SearchTimeout
+        # Reading the clock every node would cost more than the search itself
+        if self.deadline is not None and self.nodes & 31 == 0:
+            if time.perf_counter() >= self.deadline:
+                raise SearchTimeout
+
+
+def search(config, mine, theirs, depth, alpha, beta, last_move, budget=None):
+    # Depth-limited negamax alpha-beta; mine is the side to move, theirs just
+    # played last_move. Wins score WIN_SCORE plus the empty squares left, so
+    # quicker wins and slower losses are preferred.
+    if budget is not None:
+        budget.tick()
+    empties = config.squares - (mine | theirs).bit_count()
+    if last_move is not None and config.wins(theirs, last_move):
+        return -(WIN_SCORE + empties)
+    if empties == 0:
+        return 0
+    if depth == 0:
+        return evaluate(config, mine, theirs)
+
+    best_score = -math.inf
+    for move in candidate_moves(config, mine, theirs):
+        score = -search(
+            config, theirs, mine | 1 << move, depth - 1, -beta, -alpha, move, budget
+        )
+        if score > best_score:
+            best_score = score
+        alpha = max(alpha, score)
+        if alpha >= beta:
+            break
+    return best_score
+
+
+def root_search(config, board, player, depth, first=None, budget=None):
+    # Best move and its score at a fixed depth, searching first before the rest
+    x, o = to_bits(board)
+    mine, theirs = (x, o) if player == "X" else (o, x)
+    best_score = -math.inf
+    move = None
+    for square in candidate_moves(config, mine, theirs, first):
+        child = mine | 1 << square
+        score = -search(
+            config, theirs, child, depth - 1, -math.inf, -best_score, square, budget
+        )
+        if score > best_score:
+            best_score = score
+            move = square
+    return move, best_score
+
+
+def best_move(board, player="O", config=None, depth=None):
+    # Depth-limited best move for player on an N x N board (None if it is full)
+    config = config or config_for(board)
+    depth = depth or config.default_depth
+    return root_search(config, board, player, depth)[0]
+
+
+def iterative_deepening(
+    board, player="O", config=None, time_limit=0.05, node_limit=None, max_depth=None
+):
+    # Anytime search: deepen one ply at a time, trying the previous best move first,
+    # and keep the result of the deepest completed iteration. Returns
+    # (move, score, completed depth, nodes searched).
+    config = config or config_for(board)
+    x, o = to_bits(board)
+    mine, theirs = (x, o) if player == "X" else (o, x)
+    moves = candidate_moves(config, mine, theirs)
+    if not moves:
+        return None, 0, 0, 0
+    move, score, completed = moves[0], 0, 0  # best so far before any search
+    if len(moves) == 1:
+        return move, score, completed, 0
+
+    budget = SearchBudget(time_limit, node_limit)
+    empties = board.count(" ")
+    for depth in range(1, min(max_depth or empties, empties) + 1):
+        try:
+            result = root_search(config, board, player, depth, move, budget)
+        except SearchTimeout:
+            break
+        move, score = result
+        completed = depth
+        if abs(score) >= WIN_SCORE:
+            break  # forced win or loss found; deeper search cannot change it
+    return move, score, completed, budget.nodes
+
+
+@minimax.instrumented
+def best_move_timed(board, player="O", config=None, time_limit=0.05, node_limit=None):
+    # best_move that always answers within time_limit seconds (and/or node_limit nodes)
+    return iterative_deepening(board, player, config, time_limit, node_limit)[0]
+
+
+class KInARowGame:
+    # TicTacToe-style game class for any board configuration
+    def __init__(self, size=3, win_length=None):
+        self.config = get_config(size, win_length)
+        self.player_wins = 0  # Player wins counter
+        self.ai_wins = 0  # AI wins counter
+        self.reset()
+
+    def reset(self):
+        self.board = [" " for _ in range(self.config.squares)]
+        self.bits = {"X": 0, "O": 0}
+        self.current_winner = None
+
+    def available_moves(self):
+        return [i for i, spot in enumerate(self.board) if spot == " "]
+
+    def make_move(self, square, letter):
+        if self.board[square] == " ":
+            self.board[square] = letter
+            self.bits[letter] |= 1 << square
+            if self.config.wins(self.bits[letter], square):
+                self.current_winner = letter
+            return True
+        return False
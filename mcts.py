@@ -0,0 +1,280 @@
+import argparse
+import math
+import random
+import time
+from multiprocessing import Pool
+import minimax
+from kinarow import config_for, get_config, to_bits
+
+OPPONENT = {"X": "O", "O": "X"}
+EXPLORATION = math.sqrt(2)  # UCT exploration constant
+
+
+class Node:
+    __slots__ = ("move", "parent", "children", "untried", "x", "o", "to_move")
+
+    def __init__(self, config, x, o, to_move, move=None, parent=None):
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.x = x
+        self.o = o
+        self.to_move = to_move
+        if is_terminal(config, x, o, move):
+            self.untried = []
+        else:
+            self.untried = empty_squares(config, x, o)
+
+
+class Stats:
+    # Visit counts and results are kept apart from Node so trees can be merged
+    __slots__ = ("visits", "value")
+
+    def __init__(self):
+        self.visits = 0
+        self.value = 0.0  # from the point of view of the player who made node.move
+
+
+def empty_squares(config, x, o):
+    occupied = x | o
+    return [s for s in config.move_order if not occupied >> s & 1]
+
+
+def is_terminal(config, x, o, move):
+    if move is not None and (config.wins(x, move) or config.wins(o, move)):
+        return True
+    return (x | o) == config.full_mask
+
+
+def rollout(config, x, o, to_move, rng):
+    # Random playout to the end; returns "X", "O" or None for a draw
+    squares = empty_squares(config, x, o)
+    rng.shuffle(squares)
+    for square in squares:
+        if to_move == "X":
+            x |= 1 << square
+            if config.wins(x, square):
+                return "X"
+        else:
+            o |= 1 << square
+            if config.wins(o, square):
+                return "O"
+        to_move = OPPONENT[to_move]
+    return None
+
+
+def winner_of(config, node):
+    if node.move is None:
+        return None
+    if config.wins(node.x, node.move):
+        return "X"
+    if config.wins(node.o, node.move):
+        return "O"
+    return None
+
+
+def rollout_batch(args):
+    # Worker task for leaf parallelism: (wins for X, wins for O, draws)
+    size, win_length, x, o, to_move, count, seed = args
+    config = get_config(size, win_length)
+    rng = random.Random(seed)
+    results = {"X": 0, "O": 0, None: 0}
+    for _ in range(count):
+        results[rollout(config, x, o, to_move, rng)] += 1
+    return results["X"], results["O"], results[None]
+
+
+class Tree:
+    def __init__(self, config, board, player, seed=None):
+        self.config = config
+        x, o = to_bits(board)
+        self.root = Node(config, x, o, player)
+        self.stats = {self.root: Stats()}
+        self.rng = random.Random(seed)
+        self.playouts = 0
+
+    def select(self):
+        node = self.root
+        while not node.untried and node.children:
+            log_visits = math.log(self.stats[node].visits)
+            node = max(
+                node.children,
+                key=lambda child: self.stats[child].value / self.stats[child].visits
+                + EXPLORATION * math.sqrt(log_visits / self.stats[child].visits),
+            )
+        return node
+
+    def expand(self, node):
+        if not node.untried:
+            return node  # terminal
+        square = node.untried.pop()
+        x, o = node.x, node.o
+        if node.to_move == "X":
+            x |= 1 << square
+        else:
+            o |= 1 << square
+        child = Node(self.config, x, o, OPPONENT[node.to_move], square, node)
+        node.children.append(child)
+        self.stats[child] = Stats()
+        return child
+
+    def backpropagate(self, node, x_wins, o_wins, draws):
+        total = x_wins + o_wins + draws
+        self.playouts += total
+        while node is not None:
+            stats = self.stats[node]
+            mover = OPPONENT[node.to_move]  # the player who made node.move
+            wins = x_wins if mover == "X" else o_wins
+            stats.visits += total
+            stats.value += wins + 0.5 * draws
+            node = node.parent
+
+    def leaf_results(self, node, rollouts, pool=None, workers=1):
+        winner = winner_of(self.config, node)
+        if winner or not node.untried and not node.children:
+            # Terminal node: every "playout" has the same result
+            return (
+                rollouts if winner == "X" else 0,
+                rollouts if winner == "O" else 0,
+                rollouts if winner is None else 0,
+            )
+        if pool is None:
+            results = {"X": 0, "O": 0, None: 0}
+            for _ in range(rollouts):
+                results[
+                    rollout(self.config, node.x, node.o, node.to_move, self.rng)
+                ] += 1
+            return results["X"], results["O"], results[None]
+        # Leaf parallelism: split the batch of playouts across the pool
+        share, extra = divmod(rollouts, workers)
+        chunks = [share + (i < extra) for i in range(workers)]
+        tasks = [
+            (
+                self.config.size,
+                self.config.win_length,
+                node.x,
+                node.o,
+                node.to_move,
+                count,
+                self.rng.getrandbits(32),
+            )
+            for count in chunks
+            if count
+        ]
+        batches = pool.map(rollout_batch, tasks)
+        return tuple(sum(batch[i] for batch in batches) for i in range(3))
+
+    def run(self, iterations=None, time_limit=None, rollouts=1, pool=None, workers=1):
+        deadline = time.perf_counter() + time_limit if time_limit else None
+        done = 0
+        while iterations is None or done < iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            node = self.expand(self.select())
+            results = self.leaf_results(node, rollouts, pool, workers)
+            self.backpropagate(node, *results)
+            done += 1
+        return self.root_statistics()
+
+    def root_statistics(self):
+        # move -> (visits, value) for each child of the root
+        return {
+            child.move: (self.stats[child].visits, self.stats[child].value)
+            for child in self.root.children
+        }
+
+
+def search_root(args):
+    # Worker task for root parallelism: build an independent tree
+    board, player, size, win_length, iterations, time_limit, rollouts, seed = args
+    tree = Tree(get_config(size, win_length), board, player, seed)
+    return tree.run(iterations, time_limit, rollouts), tree.playouts
+
+
+def merge(statistics):
+    merged = {}
+    for root_stats in statistics:
+        for move, (visits, value) in root_stats.items():
+            total_visits, total_value = merged.get(move, (0, 0.0))
+            merged[move] = (total_visits + visits, total_value + value)
+    return merged
+
+
+def run_search(
+    board,
+    player="O",
+    config=None,
+    iterations=2000,
+    time_limit=None,
+    rollouts=1,
+    workers=1,
+    parallel="root",
+    seed=None,
+):
+    # Returns (merged root statistics, total playouts)
+    config = config or config_for(board)
+    board = list(board)
+    if workers <= 1:
+        tree = Tree(config, board, player, seed)
+        return tree.run(iterations, time_limit, rollouts), tree.playouts
+
+    seeds = random.Random(seed).sample(range(1 << 30), workers)
+    with Pool(workers) as pool:
+        if parallel == "leaf":
+            tree = Tree(config, board, player, seeds[0])
+            statistics = tree.run(iterations, time_limit, rollouts, pool, workers)
+            return statistics, tree.playouts
+        # Root parallelism: one tree per worker, statistics merged at the root
+        share = None if iterations is None else -(-iterations // workers)
+        tasks = [
+            (board, player, config.size, config.win_length)
+            + (share, time_limit, rollouts, worker_seed)
+            for worker_seed in seeds
+        ]
+        results = pool.map(search_root, tasks)
+    return merge(stats for stats, _ in results), sum(n for _, n in results)
+
+
+@minimax.instrumented
+def best_move(board, player="O", config=None, **options):
+    # Most-visited root move (None if the board is full); options go to run_search
+    statistics, _ = run_search(board, player, config, **options)
+    if not statistics:
+        return None
+    return max(statistics, key=lambda move: (statistics[move][0], -move))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MCTS playouts/sec")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=None)
+    parser.add_argument("--time", type=float, default=2.0, help="seconds per run")
+    parser.add_argument("--rollouts", type=int, default=8, help="playouts per leaf")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--parallel", choices=["root", "leaf"], default="root")
+    args = parser.parse_args()
+
+    config = get_config(args.size, args.win_length)
+    board = [" "] * config.squares
+    for workers in args.workers:
+        start = time.perf_counter()
+        statistics, playouts = run_search(
+            board,
+            "X",
+            config,
+            iterations=None,
+            time_limit=args.time,
+            rollouts=args.rollouts,
+            workers=workers,
+            parallel=args.parallel,
+        )
+        elapsed = time.perf_counter() - start
+        move = max(statistics, key=lambda m: statistics[m][0])
+        print(
+            f"{workers} worker(s): {playouts} playouts in {elapsed:.2f}s "
+            f"({playouts / elapsed:,.0f} playouts/sec), best move {move}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import csv
+import json
+import os
+from collections import deque
+
+FIELDS = ["game", "outcome", "win_rate", "draw_rate", "loss_rate"]
+OUTCOMES = {"X": "win", "O": "loss", None: "draw"}  # winner -> Q AI outcome
+
+
+class MetricsSink:
+    # Streams one row per game (with rolling win/draw/loss rates) to a CSV or JSONL
+    # file, buffering rows and writing them every `flush_every` games
+    def __init__(self, path=None, window=100, flush_every=500):
+        self.path = path
+        self.window = deque(maxlen=window)
+        self.counts = {"win": 0, "draw": 0, "loss": 0}  # within the window
+        self.totals = {"win": 0, "draw": 0, "loss": 0}
+        self.games = 0
+        self.flush_every = flush_every
+        self.buffer = []
+        self.file = None
+        self.writer = None
+        if path is not None:
+            self.file = open(path, "w", newline="")
+            if not path.endswith(".jsonl"):
+                self.writer = csv.writer(self.file)
+                self.writer.writerow(FIELDS)
+
+    def record(self, winner):
+        # O(1): the outcome leaving the window is subtracted from the counts
+        outcome = OUTCOMES[winner]
+        if len(self.window) == self.window.maxlen:
+            self.counts[self.window[0]] -= 1
+        self.window.append(outcome)
+        self.counts[outcome] += 1
+        self.totals[outcome] += 1
+        self.games += 1
+        if self.file is not None:
+            rates = self.rates()
+            self.buffer.append(
+                [self.games, outcome, rates["win"], rates["draw"], rates["loss"]]
+            )
+            if len(self.buffer) >= self.flush_every:
+                self.flush()
+
+    def rates(self):
+        size = len(self.window) or 1
+        return {outcome: count / size for outcome, count in self.counts.items()}
+
+    def flush(self):
+        if self.file is None or not self.buffer:
+            return
+        if self.writer is not None:
+            self.writer.writerows(self.buffer)
+        else:
+            lines = (json.dumps(dict(zip(FIELDS, row))) + "\n" for row in self.buffer)
+            self.file.write("".join(lines))
+        self.file.flush()
+        self.buffer.clear()
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def read_rows(path):
+    # Streams rows back from a metrics file without loading it whole
+    with open(path, newline="") as file:
+        if path.endswith(".jsonl"):
+            for line in file:
+                yield json.loads(line)
+        else:
+            for row in csv.DictReader(file):
+                yield {
+                    "game": int(row["game"]),
+                    "outcome": row["outcome"],
+                    **{field: float(row[field]) for field in FIELDS[2:]},
+                }
+
+
+def learning_curve(path, points=500):
+    # Downsampled (game, win, draw, loss rate) curve in O(points) memory: rows are
+    # averaged into buckets, and adjacent buckets merge whenever there are too many
+    bucket_size, filled = 1, 0
+    buckets = []
+    sums = [0.0, 0.0, 0.0, 0.0]
+    if not os.path.exists(path):
+        return buckets
+    for row in read_rows(path):
+        values = (row["game"], row["win_rate"], row["draw_rate"], row["loss_rate"])
+        for i, value in enumerate(values):
+            sums[i] += value
+        filled += 1
+        if filled == bucket_size:
+            buckets.append([value / bucket_size for value in sums])
+            sums, filled = [0.0, 0.0, 0.0, 0.0], 0
+            if len(buckets) == 2 * points:
+                buckets = [
+                    [(a + b) / 2 for a, b in zip(first, second)]
+                    for first, second in zip(buckets[::2], buckets[1::2])
+                ]
+                bucket_size *= 2
+    if filled:
+        buckets.append([value / filled for value in sums])
+    return buckets
+
+
+def plot_learning_curve(path, title, points=500):
+    import matplotlib.pyplot as plt
+
+    curve = learning_curve(path, points)
+    games = [point[0] for point in curve]
+    plt.figure(figsize=(8, 6))
+    for column, label, color in (
+        (1, "Win rate", "blue"),
+        (2, "Draw rate", "green"),
+        (3, "Loss rate", "red"),
+    ):
+        plt.plot(games, [point[column] for point in curve], label=label, color=color)
+    plt.title(title)
+    plt.xlabel("Games")
+    plt.ylabel("Rolling rate")
+    plt.ylim(0, 1)
+    plt.grid(True)
+    plt.legend()
+    plt.show()
@@ -1,55 +1,428 @@
+import functools
+import json
 import math
+import random
+import time
+from collections import Counter, OrderedDict, deque
+from bitboard import BitBoard
+
+# Zobrist keys: one random 64-bit number per (letter, square), plus one for the side to move
+_zobrist_rng = random.Random(20241)
+ZOBRIST = {
+    letter: [_zobrist_rng.getrandbits(64) for _ in range(9)] for letter in ("X", "O")
+}
+ZOBRIST_MAXIMIZING = _zobrist_rng.getrandbits(64)
+
+# Bound types stored in the transposition table
+EXACT = 0
+LOWER = 1  # stored value is a lower bound (search failed high)
+UPPER = 2  # stored value is an upper bound (search failed low)
+
+
+def zobrist_hash(board):
+    # Full hash of a board; searches update it incrementally after this
+    key = 0
+    for i, spot in enumerate(board):
+        if spot != " ":
+            key ^= ZOBRIST[spot][i]
+    return key
+
+
+class TranspositionTable:
+    def __init__(self, max_size=100000):
+        # Entries are key -> (value, flag, move), kept in least-recently-used order
+        self.entries = OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def store(self, key, value, flag=EXACT, move=None):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        elif len(self.entries) >= self.max_size:
+            self.entries.popitem(last=False)  # evict the least recently used entry
+            self.evictions += 1
+        self.entries[key] = (value, flag, move)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class SearchStats:
+    # Counters for one best_move call
+    def __init__(self):
+        self.nodes_per_depth = Counter()
+        self.terminal_evals = 0
+        self.cache_hits = 0
+        self.cutoffs = 0
+        self.expanded = 0  # interior nodes whose children were searched
+        self.children = 0  # children searched below those nodes
+        self.seconds = 0.0
+
+    def branching_factor(self):
+        return self.children / self.expanded if self.expanded else 0.0
+
+    def to_dict(self):
+        return {
+            "nodes": sum(self.nodes_per_depth.values()),
+            "nodes_per_depth": dict(sorted(self.nodes_per_depth.items())),
+            "terminal_evals": self.terminal_evals,
+            "cache_hits": self.cache_hits,
+            "cutoffs": self.cutoffs,
+            "branching_factor": round(self.branching_factor(), 3),
+            "seconds": self.seconds,
+        }
+
+
+class LatencyHistogram:
+    # Rolling histogram over the latest best_move latencies
+    BUCKETS_MS = (0.01, 0.1, 1, 10, 100, 1000)
+
+    def __init__(self, window=1000):
+        self.samples = deque(maxlen=window)
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+
+    def counts(self):
+        # Samples per bucket, keyed by upper bound in milliseconds ("inf" for the rest)
+        counts = {bound: 0 for bound in self.BUCKETS_MS}
+        counts["inf"] = 0
+        for seconds in self.samples:
+            ms = seconds * 1000
+            bucket = next((bound for bound in self.BUCKETS_MS if ms <= bound), "inf")
+            counts[bucket] += 1
+        return counts
+
+    def percentile(self, fraction):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Instrumentation:
+    def __init__(self, window=1000, profile_path=None):
+        self.last = None  # SearchStats of the latest call
+        self.calls = 0
+        self.histogram = LatencyHistogram(window)
+        self.profile = open(profile_path, "a") if profile_path else None
+        self.active = 0  # nesting depth, so only the outermost call is recorded
+
+    def begin(self):
+        global _search_stats
+        self.active += 1
+        if self.active == 1:
+            _search_stats = SearchStats()
+            _search_stats.seconds = time.perf_counter()
+
+    def end(self, name, board, move):
+        global _search_stats
+        self.active -= 1
+        if self.active:
+            return
+        stats = _search_stats
+        _search_stats = None
+        stats.seconds = time.perf_counter() - stats.seconds
+        self.last = stats
+        self.calls += 1
+        self.histogram.add(stats.seconds)
+        if self.profile is not None:
+            record = {"call": name, "board": "".join(board), "move": move}
+            record.update(stats.to_dict())
+            self.profile.write(json.dumps(record) + "\n")
+            self.profile.flush()
+
+    def close(self):
+        if self.profile is not None:
+            self.profile.close()
+            self.profile = None
+
+
+# Search instrumentation is off unless enabled; when off the search only pays one
+# global None check per node
+_instrumentation = None
+_search_stats = None
+
+
+def enable_instrumentation(window=1000, profile_path=None):
+    # Record stats for every best_move call; profile_path appends one JSON line per call
+    global _instrumentation
+    disable_instrumentation()
+    _instrumentation = Instrumentation(window, profile_path)
+    return _instrumentation
+
+
+def disable_instrumentation():
+    global _instrumentation, _search_stats
+    if _instrumentation is not None:
+        _instrumentation.close()
+    _instrumentation = None
+    _search_stats = None
+
+
+def instrumented(func):
+    # Time a best_move-style function while instrumentation is on; when off a call
+    # only pays one global None check, however the caller imported the function
+    @functools.wraps(func)
+    def wrapper(board, *args, **kwargs):
+        instrumentation = _instrumentation
+        if instrumentation is None:
+            return func(board, *args, **kwargs)
+        instrumentation.begin()
+        move = None
+        try:
+            move = func(board, *args, **kwargs)
+            return move
+        finally:
+            instrumentation.end(func.__module__ + "." + func.__name__, board, move)
+
+    return wrapper
+
+
+# Shared tables so repeated best_move calls reuse earlier searches. The alpha-beta
+# search stores bounds from the side to move's point of view, so it gets its own table.
+default_table = TranspositionTable()
+alphabeta_table = TranspositionTable()
+
+# Alpha-beta move ordering: center, then corners, then edges
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+OPPONENT = {"X": "O", "O": "X"}
 
 
 # Minimax function that determines the best move for the AI (O)
-def minimax(board, depth, is_maximizing):
+def minimax(board, depth, is_maximizing, table=None, key=None):
     # Define the scores for winning, losing, and drawing
     scores = {"X": -1, "O": 1, "tie": 0}
 
+    stats = _search_stats
+    if stats is not None:
+        stats.nodes_per_depth[depth] += 1
+
     # Base case: check if the game is over
     winner = check_winner(board)
     if winner:
+        if stats is not None:
+            stats.terminal_evals += 1
         return scores[winner]
 
+    # Look up the position (board + side to move) in the transposition table
+    if table is not None:
+        if key is None:
+            key = zobrist_hash(board)
+        node_key = key ^ ZOBRIST_MAXIMIZING if is_maximizing else key
+        entry = table.lookup(node_key)
+        if entry is not None and entry[1] == EXACT:
+            if stats is not None:
+                stats.cache_hits += 1
+            return entry[0]
+
+    if stats is not None:
+        stats.expanded += 1
+        stats.children += board.count(" ")
+    best_index = None
     # Maximizing player's turn (AI - O)
     if is_maximizing:
         best_score = -math.inf  # negative infinity
         for i in range(9):  # iterate through all possible moves
             if board[i] == " ":
                 board[i] = "O"
-                score = minimax(board, depth + 1, False)
+                child_key = key ^ ZOBRIST["O"][i] if table is not None else None
+                score = minimax(board, depth + 1, False, table, child_key)
                 board[i] = " "
-                best_score = max(score, best_score)
-        return best_score
+                if score > best_score:
+                    best_score = score
+                    best_index = i
     # Minimizing player's turn (Human - X)
     else:
         best_score = math.inf  # positive infinity
         for i in range(9):  # iterate through all possible moves
             if board[i] == " ":
                 board[i] = "X"
-                score = minimax(board, depth + 1, True)
+                child_key = key ^ ZOBRIST["X"][i] if table is not None else None
+                score = minimax(board, depth + 1, True, table, child_key)
                 board[i] = " "
-                best_score = min(score, best_score)
-        return best_score
+                if score < best_score:
+                    best_score = score
+                    best_index = i
+
+    if table is not None:
+        # Full-width search, so every stored value is exact
+        table.store(node_key, best_score, EXACT, best_index)
+    return best_score
 
 
 # Function to determine the best move for AI
-def best_move(board):
+@instrumented
+def best_move(board, table=default_table):
+    if table is not None:
+        # A previous search from this position already knows the best move
+        key = zobrist_hash(board)
+        entry = table.lookup(key ^ ZOBRIST_MAXIMIZING)
+        if entry is not None and entry[1] == EXACT and entry[2] is not None:
+            if _search_stats is not None:
+                _search_stats.cache_hits += 1
+            return entry[2]
+
     best_score = -math.inf  # negative infinity
     move = None
     for i in range(9):  # iterate through all possible moves
         if board[i] == " ":
             board[i] = "O"
-            score = minimax(board, 0, False)
+            child_key = key ^ ZOBRIST["O"][i] if table is not None else None
+            score = minimax(board, 1, False, table, child_key)
             board[i] = " "
             if score > best_score:
                 best_score = score
                 move = i
+    if table is not None and move is not None:
+        table.store(key ^ ZOBRIST_MAXIMIZING, best_score, EXACT, move)
+    return move
+
+
+def ordered_moves(board, first=None):
+    # Empty squares in search order, with a previously found best move tried first
+    moves = [i for i in MOVE_ORDER if board[i] == " " and i != first]
+    if first is not None and board[first] == " ":
+        moves.insert(0, first)
+    return moves
+
+
+def terminal_score(winner, player, board):
+    # Depth-aware score from player's point of view: a win with more empty squares
+    # left was reached in fewer plies, so quick wins and slow losses score best
+    if winner == "tie":
+        return 0
+    score = 1 + board.count(" ")
+    return score if winner == player else -score
+
+
+# Alpha-beta (negamax) search; scores are from the point of view of player, the side to move
+def alphabeta(board, depth, alpha, beta, player, table=None, key=None):
+    stats = _search_stats
+    if stats is not None:
+        stats.nodes_per_depth[depth] += 1
+
+    winner = check_winner(board)
+    if winner:
+        if stats is not None:
+            stats.terminal_evals += 1
+        return terminal_score(winner, player, board)
+
+    alpha_original = alpha
+    hash_move = None
+    if table is not None:
+        if key is None:
+            key = zobrist_hash(board)
+        node_key = key ^ ZOBRIST_MAXIMIZING if player == "O" else key
+        entry = table.lookup(node_key)
+        if entry is not None:
+            value, flag, hash_move = entry
+            if flag == EXACT:
+                if stats is not None:
+                    stats.cache_hits += 1
+                return value
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                if stats is not None:
+                    stats.cache_hits += 1
+                return value
+
+    opponent = OPPONENT[player]
+    best_score = -math.inf
+    best_index = None
+    if stats is not None:
+        stats.expanded += 1
+    for i in ordered_moves(board, hash_move):
+        board[i] = player
+        child_key = key ^ ZOBRIST[player][i] if table is not None else None
+        score = -alphabeta(board, depth + 1, -beta, -alpha, opponent, table, child_key)
+        board[i] = " "
+        if stats is not None:
+            stats.children += 1
+        if score > best_score:
+            best_score = score
+            best_index = i
+        alpha = max(alpha, score)
+        if alpha >= beta:
+            if stats is not None:
+                stats.cutoffs += 1
+            break  # the opponent will never allow this line
+
+    if table is not None:
+        if best_score <= alpha_original:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        table.store(node_key, best_score, flag, best_index)
+    return best_score
+
+
+# Alpha-beta version of best_move that can play either side
+@instrumented
+def best_move_alphabeta(board, player="O", table=alphabeta_table):
+    key = zobrist_hash(board) if table is not None else None
+    hash_move = None
+    if table is not None:
+        entry = table.lookup(key ^ ZOBRIST_MAXIMIZING if player == "O" else key)
+        if entry is not None:
+            hash_move = entry[2]
+
+    opponent = OPPONENT[player]
+    best_score = -math.inf
+    move = None
+    for i in ordered_moves(board, hash_move):
+        board[i] = player
+        child_key = key ^ ZOBRIST[player][i] if table is not None else None
+        # Window just below the best score so far: ties come back exact and the
+        # lowest square wins them, matching the full-width best_move
+        window = 1 - best_score
+        score = -alphabeta(board, 1, -math.inf, window, opponent, table, child_key)
+        board[i] = " "
+        if score > best_score or (score == best_score and i < move):
+            best_score = score
+            move = i
+
+    if table is not None and move is not None:
+        node_key = key ^ ZOBRIST_MAXIMIZING if player == "O" else key
+        table.store(node_key, best_score, EXACT, move)
     return move
 
 
 # Check winner function (similar to the one in TicTacToe class)
 def check_winner(board):
+    if isinstance(board, BitBoard):
+        return board.winner()  # precomputed win lookup instead of scanning the lines
+
     # Check rows, columns, and diagonals for a win
     win_conditions = [
         (0, 1, 2),
@@ -0,0 +1,66 @@
+from symmetry import canonical_key
+
+
+class QTableAgent:
+    # Q-table storage and episode learning shared by the Q-learning agents. Subclasses
+    # call init_table from __init__ and provide learning_rates() -> (alpha, gamma).
+    def init_table(self, canonical=False, dense=False, trace_decay=None):
+        if dense:
+            from dense_qtable import DenseQTable  # NumPy is only needed for this
+
+            self.q_table = DenseQTable()  # Stores Q-values in one float32 array
+        else:
+            self.q_table = {}
+        self.dense = dense
+        # Share one entry between the 8 rotations/reflections of a board
+        self.canonical = canonical
+        self.raw_states = {}  # canonical state -> raw states seen that fold into it
+        # Lambda for episode-level learning (1 = Monte Carlo returns); None keeps
+        # the one-step update_q_table after every move
+        self.trace_decay = trace_decay
+
+    def learning_rates(self):
+        raise NotImplementedError
+
+    def state_key(self, state, action):
+        if not self.canonical:
+            return (tuple(state), action)
+        key = canonical_key(state, action)
+        self.raw_states.setdefault(key[0], set()).add(tuple(state))
+        return key
+
+    def fold_counts(self):
+        # How many raw states seen so far fold into each canonical state
+        return {state: len(raw) for state, raw in self.raw_states.items()}
+
+    def get_q_value(self, state, action):
+        return self.q_table.get(self.state_key(state, action), 0.0)
+
+    def action_values(self, state, available_moves):
+        if self.dense and not self.canonical:
+            # One index lookup for the whole row instead of one key per move
+            row = self.q_table.row(state).tolist()
+            return {move: row[move] for move in available_moves}
+        return {move: self.get_q_value(state, move) for move in available_moves}
+
+    def learn_episode(self, trajectory):
+        # trajectory: (state, action, reward) for each of our moves, where reward
+        # arrives after the opponent's reply and the next state is the following
+        # entry's state. Updates toward lambda-returns, last move first.
+        alpha, gamma = self.learning_rates()
+        target = 0.0
+        for i in range(len(trajectory) - 1, -1, -1):
+            state, action, reward = trajectory[i]
+            if i + 1 < len(trajectory):
+                next_state = trajectory[i + 1][0]
+                moves = [move for move, spot in enumerate(next_state) if spot == " "]
+                max_next_q = max(self.action_values(next_state, moves).values())
+                target = reward + gamma * (
+                    (1 - self.trace_decay) * max_next_q + self.trace_decay * target
+                )
+            else:
+                target = reward
+            current_q = self.get_q_value(state, action)
+            self.q_table[self.state_key(state, action)] = current_q + alpha * (
+                target - current_q
+            )
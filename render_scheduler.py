@@ -0,0 +1,257 @@
+import os
+import queue
+import threading
+import tkinter as tk
+from checkpoint import CheckpointWriter, load_checkpoint
+from convergence import ConvergenceMonitor
+from game import TicTacToe
+from metrics import MetricsSink, plot_learning_curve
+from trainer import Trainer
+
+FRAME_MS = 33  # redraw about 30 times a second
+
+
+class StopTraining(Exception):
+    pass
+
+
+class TrainingRunner:
+    # Runs trainer.train on a worker thread that publishes (board, stats, games)
+    # snapshots into a small bounded queue; the Tk thread takes the newest one every
+    # FRAME_MS through root.after, so frames the screen cannot show are dropped.
+    # Boards are published for every game (sample_every=1) or every Nth game;
+    # stats go out after every game.
+    def __init__(
+        self,
+        root,
+        trainer,
+        games,
+        on_frame,
+        on_game=None,
+        on_finish=None,
+        monitor=None,
+        sample_every=1,
+        setup=None,
+    ):
+        self.root = root
+        self.trainer = trainer
+        self.games = games
+        self.on_frame = on_frame  # Tk thread: on_frame(board, stats, games_played)
+        self.on_game = on_game  # worker thread: must not touch widgets
+        self.on_finish = on_finish  # Tk thread, once training has ended or failed
+        self.monitor = monitor
+        self.sample_every = sample_every
+        self.setup = setup  # worker thread, before training (checkpoint loads, ...)
+        self.frames = queue.Queue(maxsize=2)
+        self.stopping = threading.Event()
+        self.finished = threading.Event()
+        self.error = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        self.root.after(FRAME_MS, self.consume)
+
+    def stop(self):
+        # Ends training after the current move
+        self.stopping.set()
+
+    def run(self):
+        try:
+            if self.setup is not None:
+                self.setup()
+            self.trainer.train(
+                self.games,
+                on_move=self.publish_move,
+                on_game=self.publish_game,
+                monitor=self.monitor,
+            )
+        except StopTraining:
+            pass
+        except Exception as error:
+            self.error = error
+        finally:
+            self.finished.set()
+
+    def watching(self, game_index):
+        return game_index % self.sample_every == 0
+
+    def publish(self, board):
+        frame = (board, dict(self.trainer.stats), self.trainer.games_played)
+        while True:
+            try:
+                self.frames.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self.frames.get_nowait()  # drop the oldest unshown frame
+                except queue.Empty:
+                    pass
+
+    def publish_move(self):
+        if self.stopping.is_set():
+            raise StopTraining
+        if self.watching(self.trainer.games_played):
+            self.publish(self.trainer.game.state())
+
+    def publish_game(self):
+        if self.on_game is not None:
+            self.on_game()
+        # games_played already counts this game; unwatched games publish stats only
+        watched = self.watching(self.trainer.games_played - 1)
+        self.publish(self.trainer.game.state() if watched else None)
+
+    def consume(self):
+        frame = None
+        while True:
+            try:
+                frame = self.frames.get_nowait()
+            except queue.Empty:
+                break
+        if frame is not None:
+            self.on_frame(*frame)
+        if not self.finished.is_set() or not self.frames.empty():
+            self.root.after(FRAME_MS, self.consume)
+            return
+        try:
+            if self.error is not None:
+                raise self.error  # reported by Tk once on_finish has cleaned up
+        finally:
+            if self.on_finish is not None:
+                self.on_finish()
+
+
+class TrainingViewer:
+    # Window that watches a Q AI train against the minimax opponent. Subclasses pick
+    # the agent (make_agent), its draw reward and where metrics, checkpoints and the
+    # learning-curve title go; without a checkpoint_path nothing is resumed or saved
+    # and without a plot_title no plot is shown at the end.
+    draw_reward = 0
+    metrics_path = None
+    checkpoint_path = None
+    plot_title = None
+    games = 10000
+
+    def __init__(self, root, sample_every=1):
+        self.root = root
+        self.sample_every = sample_every  # show every game, or every Nth one
+        self.closing = False
+        self.done = False
+        self.game = TicTacToe()
+        self.q_ai = self.make_agent()
+        self.checkpoints = None
+        if self.checkpoint_path:
+            self.checkpoints = CheckpointWriter(
+                self.q_ai, self.checkpoint_path, every=1000
+            )
+        self.trainer = Trainer(self.q_ai, self.game, rewards={"draw": self.draw_reward})
+        self.stats = self.trainer.stats
+        self.metrics = MetricsSink(self.metrics_path, window=100, flush_every=500)
+        # Stops training once the greedy policy and Q-values settle
+        self.monitor = ConvergenceMonitor(self.q_ai, window=500, threshold=1e-3)
+
+        # GUI board
+        self.board_buttons = [
+            tk.Label(
+                root, text=" ", font="normal 20", width=5, height=2, bg="lightgray"
+            )
+            for _ in range(9)
+        ]
+        for i, button in enumerate(self.board_buttons):
+            row, col = divmod(i, 3)
+            button.grid(row=row, column=col)
+
+        # Stats display
+        self.stats_label = tk.Label(root, text="", font="normal 12", bg="white")
+        self.stats_label.grid(row=3, column=0, columnspan=3)
+
+        self.ratios_label = tk.Label(root, text="", font="normal 12", bg="white")
+        self.ratios_label.grid(row=4, column=0, columnspan=3)
+
+        # Start simulation
+        self.run_game()
+
+    def make_agent(self):
+        raise NotImplementedError
+
+    def update_board(self, board):
+        for i, cell in enumerate(board):
+            self.board_buttons[i].config(text=cell)
+
+    def run_game(self):
+        # Train on a worker thread; the window redraws from its snapshots at a fixed
+        # frame rate instead of after every move
+        self.runner = TrainingRunner(
+            self.root,
+            self.trainer,
+            self.games,
+            self.draw_frame,
+            on_game=self.end_game,
+            on_finish=self.finish,
+            monitor=self.monitor,
+            sample_every=self.sample_every,
+            setup=self.load_checkpoint,
+        )
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self.runner.start()
+
+    def load_checkpoint(self):
+        # Runs on the training thread, so the window is up before the Q-table loads
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            load_checkpoint(self.q_ai, self.checkpoint_path)
+
+    def end_game(self):
+        # Runs on the training thread
+        self.metrics.record(self.game.current_winner)
+        if self.checkpoints is not None:
+            self.checkpoints.maybe_save(self.trainer.games_played)
+
+    def draw_frame(self, board, stats, games_played):
+        if board is not None:
+            self.update_board(board)
+        self.update_stats(stats)
+
+    def finish(self):
+        if self.checkpoints is not None:
+            self.checkpoints.close()
+        self.metrics.close()
+        self.done = True
+        if self.closing:
+            self.root.destroy()
+            return
+        if self.monitor.converged_at is not None:
+            print(f"Converged after {self.monitor.converged_at} games")
+        if self.plot_title:
+            self.plot_performance()
+
+    def close(self):
+        # Stop training first so finish() still saves and flushes what was learned
+        if self.done:
+            self.root.destroy()
+        else:
+            self.closing = True
+            self.runner.stop()
+
+    def plot_performance(self):
+        # Learning curves of the rolling win/draw/loss rates streamed during training
+        plot_learning_curve(self.metrics_path, self.plot_title)
+
+    def update_stats(self, stats):
+        q_ai_wins = stats["Q AI"]
+        minimax_wins = stats["Minimax AI"]
+        draws = stats["Draws"]
+        total_games = q_ai_wins + minimax_wins + draws
+
+        # Win/Loss and Draw/Loss ratios
+        win_loss_ratio = (
+            f"{q_ai_wins / (minimax_wins or 1):.2f}"  # Avoid division by zero
+        )
+        draw_loss_ratio = f"{draws / (minimax_wins or 1):.2f}"
+
+        # Update GUI labels
+        self.stats_label.config(
+            text=f"Q AI Wins: {q_ai_wins} | Minimax AI Wins: {minimax_wins} | Draws: {draws} | Total: {total_games}"
+        )
+        self.ratios_label.config(
+            text=f"Win/Loss Ratio: {win_loss_ratio} | Draw/Loss Ratio: {draw_loss_ratio}"
+        )
@@ -0,0 +1,91 @@
+import numpy as np
+from checkpoint import decode_state
+from solution_table import position_index
+
+
+class ReplayBuffer:
+    # Fixed-capacity ring buffer of transitions in preallocated arrays. States are
+    # stored as base-3 position codes; the oldest transition is overwritten when full.
+    def __init__(self, capacity=10000, seed=None):
+        self.capacity = capacity
+        self.states = np.zeros(capacity, dtype=np.int32)
+        self.actions = np.zeros(capacity, dtype=np.int8)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_states = np.zeros(capacity, dtype=np.int32)
+        self.next_legal = np.zeros((capacity, 9), dtype=bool)
+        self.dones = np.zeros(capacity, dtype=bool)
+        self.position = 0
+        self.size = 0
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return self.size
+
+    def add(self, state, action, reward, next_state, available_moves, done=None):
+        i = self.position
+        self.states[i] = position_index(state)
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = position_index(next_state)
+        self.next_legal[i] = False
+        self.next_legal[i, list(available_moves)] = True
+        self.dones[i] = not available_moves if done is None else done
+        self.position = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def add_batch(self, states, actions, rewards, next_states, next_legal, dones):
+        # Array version of add(): states/next_states are position codes
+        count = len(actions)
+        slots = (self.position + np.arange(count)) % self.capacity
+        self.states[slots] = states
+        self.actions[slots] = actions
+        self.rewards[slots] = rewards
+        self.next_states[slots] = next_states
+        self.next_legal[slots] = next_legal
+        self.dones[slots] = dones
+        self.position = (self.position + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+
+    def sample(self, batch_size):
+        # Uniform sample (with replacement) of stored transition slots
+        return self.rng.integers(0, self.size, size=batch_size)
+
+    def train(self, q_ai, batch_size=32):
+        # One TD update from a random batch; returns the number of transitions used
+        if not self.size:
+            return 0
+        batch = self.sample(batch_size)
+        if getattr(q_ai, "dense", False) and not q_ai.canonical:
+            self.dense_update(q_ai, batch)
+        else:
+            # Dict tables (and canonical keys) have no array form: one update each
+            for i in batch:
+                q_ai.update_q_table(
+                    decode_state(self.states[i]),
+                    int(self.actions[i]),
+                    float(self.rewards[i]),
+                    decode_state(self.next_states[i]),
+                    [] if self.dones[i] else np.flatnonzero(self.next_legal[i]),
+                )
+        return len(batch)
+
+    def dense_update(self, q_ai, batch):
+        # Vectorized update of a DenseQTable. Duplicate (state, action) pairs in the
+        # batch move once toward their mean target instead of stepping repeatedly.
+        table = q_ai.q_table
+        alpha, gamma = q_ai.learning_rates()
+        rows = table.rank[self.states[batch]]
+        actions = self.actions[batch].astype(np.intp)
+        next_rows = table.rank[self.next_states[batch]]
+        legal = self.next_legal[batch] & ~self.dones[batch, None]
+        next_q = np.where(legal, table.values[next_rows], -np.inf).max(axis=1)
+        next_q[~legal.any(axis=1)] = 0.0
+        targets = self.rewards[batch] + gamma * next_q
+
+        keys, inverse, counts = np.unique(
+            rows * 9 + actions, return_inverse=True, return_counts=True
+        )
+        mean_targets = np.bincount(inverse, weights=targets) / counts
+        flat = table.values.reshape(-1)
+        flat[keys] += alpha * (mean_targets - flat[keys])
+        table.visited.reshape(-1)[keys] = True
@@ -0,0 +1,222 @@
+import mmap
+import os
+import struct
+import tempfile
+import minimax
+from bitboard import BitBoard
+
+# On-disk perfect-play table for every reachable position (X moves first).
+# Positions are indexed by their base-3 code (" "=0, "X"=1, "O"=2 per square), and
+# each entry is a little-endian uint16: bits 0-8 hold the mask of every optimal
+# move, bits 9-10 the value for the side to move. A zero entry means the position
+# is terminal or unreachable.
+TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "solution_table.bin"
+)
+MAGIC = b"TTTS"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")  # magic, version, entry count
+ENTRY = struct.Struct("<H")
+NUM_POSITIONS = 3**9
+
+LOSS, DRAW, WIN = 1, 2, 3  # value codes, from the point of view of the side to move
+VALUE_NAMES = {LOSS: "loss", DRAW: "draw", WIN: "win"}
+
+POWERS = tuple(3**i for i in range(9))
+DIGITS = str.maketrans(" XO", "012")
+# Base-3 contribution of a whole 9-bit mask, so bitboards index in two lookups
+TERNARY_X = tuple(
+    sum(POWERS[i] for i in range(9) if bits >> i & 1) for bits in range(512)
+)
+TERNARY_O = tuple(2 * value for value in TERNARY_X)
+
+
+def position_index(board):
+    if isinstance(board, BitBoard):
+        return TERNARY_X[board.x] + TERNARY_O[board.o]
+    # Square 0 is the least significant digit, so read the board back to front
+    return int("".join(board[::-1]).translate(DIGITS), 3)
+
+
+def side_to_move(board):
+    # X moves first, so O is on move only when X is a piece ahead
+    return "O" if board.count("X") > board.count("O") else "X"
+
+
+def solve_position(board, table):
+    # Value and optimal-move mask for the side to move, from full minimax search
+    player = side_to_move(board)
+    child_scores = {}
+    for i in range(9):
+        if board[i] == " ":
+            board[i] = player
+            # After player moves the other side is on move; minimax scores are O-positive
+            child_scores[i] = minimax.minimax(board, 0, player == "X", table)
+            board[i] = " "
+    best = max(child_scores.values()) if player == "O" else min(child_scores.values())
+    mask = 0
+    for i, score in child_scores.items():
+        if score == best:
+            mask |= 1 << i
+    outcome = best if player == "O" else -best
+    return {1: WIN, 0: DRAW, -1: LOSS}[outcome], mask
+
+
+def build_table(path=TABLE_PATH):
+    entries = [0] * NUM_POSITIONS
+    search_table = minimax.TranspositionTable(max_size=NUM_POSITIONS)
+    seen = set()
+    stack = [[" "] * 9]
+    solved = 0
+    while stack:
+        board = stack.pop()
+        index = position_index(board)
+        if index in seen:
+            continue
+        seen.add(index)
+        if minimax.check_winner(board):
+            continue
+        value, mask = solve_position(board, search_table)
+        entries[index] = value << 9 | mask
+        solved += 1
+        player = side_to_move(board)
+        for i in range(9):
+            if board[i] == " ":
+                child = board[:]
+                child[i] = player
+                stack.append(child)
+
+    # Write to a temporary file first so readers never see a half-written table.
+    # Each builder gets its own temp file, so processes building at once never
+    # rename each other's work; they all write the same bytes, so any one may win.
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, NUM_POSITIONS))
+            f.write(struct.pack(f"<{NUM_POSITIONS}H", *entries))
+        try:
+            os.replace(temp_path, path)
+        except OSError:
+            # e.g. another process has the finished table open on Windows
+            if not os.path.exists(path):
+                raise
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return solved
+
+
+class SolutionTable:
+    def __init__(self, path=TABLE_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            # Read-only mapping: the OS shares these pages between processes
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION or count != NUM_POSITIONS:
+            self.data.close()
+            raise ValueError(f"{path} is not a version {VERSION} solution table")
+
+    def entry(self, board):
+        offset = HEADER.size + ENTRY.size * position_index(board)
+        return ENTRY.unpack_from(self.data, offset)[0]
+
+    def lookup(self, board):
+        # (value code, optimal-move mask) for the side to move, or None
+        entry = self.entry(board)
+        if entry == 0:
+            return None
+        return entry >> 9, entry & 0x1FF
+
+    def best_moves(self, board):
+        entry = self.entry(board)
+        return [i for i in range(9) if entry >> i & 1]
+
+    def best_move(self, board):
+        entry = self.entry(board) & 0x1FF
+        if entry == 0:
+            return None
+        return (entry & -entry).bit_length() - 1  # lowest optimal square, like minimax
+
+    def close(self):
+        self.data.close()
+
+
+_loaded_table = None
+
+
+def load_table(path=TABLE_PATH):
+    # Load the shared table once per process, building it on first use
+    global _loaded_table
+    if _loaded_table is None or _loaded_table.path != path:
+        if not os.path.exists(path):
+            build_table(path)
+        _loaded_table = SolutionTable(path)
+    return _loaded_table
+
+
+# Search table shared by every best_moves call for positions the table lacks
+_search_table = minimax.TranspositionTable(max_size=NUM_POSITIONS)
+
+
+def decode_position(code):
+    return [" XO"[code // POWERS[i] % 3] for i in range(9)]
+
+
+def best_moves(positions, table=None):
+    # Batch query for many positions, given as lists, tuples, BitBoards or base-3
+    # codes. Returns (value code, optimal moves, side to move) per position, where
+    # the value is for the side to move. Finished games have no moves: LOSS for the
+    # side that was beaten, DRAW for a full board. Inputs are never modified;
+    # repeated positions are answered once. Raises ValueError for codes outside
+    # 0..3**9 - 1 and for piece counts no game can reach.
+    table = table if table is not None else load_table()
+    results = []
+    seen = {}
+    for position in positions:
+        if isinstance(position, int):
+            if not 0 <= position < NUM_POSITIONS:
+                raise ValueError(f"position code out of range: {position}")
+            code = position
+        else:
+            code = position_index(position)
+        result = seen.get(code)
+        if result is None:
+            board = decode_position(code)
+            if abs(board.count("X") - board.count("O")) > 1:
+                raise ValueError(f"impossible piece counts: {board}")
+            side = side_to_move(board)
+            entry = ENTRY.unpack_from(table.data, HEADER.size + ENTRY.size * code)[0]
+            if entry == 0:
+                winner = minimax.check_winner(board)
+                if winner == "tie":
+                    entry = DRAW << 9
+                elif winner:
+                    entry = LOSS << 9
+                else:
+                    # Off the table (e.g. O moved first): solve it with shared search
+                    value, mask = solve_position(board, _search_table)
+                    entry = value << 9 | mask
+            moves = tuple(i for i in range(9) if entry >> i & 1)
+            result = seen[code] = (entry >> 9, moves, side)
+        results.append(result)
+    return results
+
+
+# Drop-in replacement for minimax.best_move: O(1) lookup for the AI (O),
+# falling back to search for positions the table does not cover
+@minimax.instrumented
+def best_move(board):
+    table = load_table()
+    if side_to_move(board) == "O":
+        move = table.best_move(board)
+        if move is not None:
+            return move
+    return minimax.best_move(board)
+
+
+if __name__ == "__main__":
+    solved = build_table()
+    print(f"Solved {solved} positions into {TABLE_PATH}")
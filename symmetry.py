@@ -0,0 +1,56 @@
+# D4 symmetry group of the 3x3 board (4 rotations x optional reflection).
+# Each transform is a permutation p with transformed[i] = board[p[i]].
+
+
+def _rotate(perm):
+    # Rotate 90 degrees clockwise: new (r, c) comes from old (2 - c, r)
+    return tuple(perm[(2 - c) * 3 + r] for r in range(3) for c in range(3))
+
+
+def _reflect(perm):
+    # Mirror left to right: new (r, c) comes from old (r, 2 - c)
+    return tuple(perm[r * 3 + 2 - c] for r in range(3) for c in range(3))
+
+
+def _build_transforms():
+    transforms = []
+    perm = tuple(range(9))
+    for _ in range(4):
+        transforms.append(perm)
+        perm = _rotate(perm)
+    transforms += [_reflect(perm) for perm in transforms]
+    return tuple(transforms)
+
+
+TRANSFORMS = _build_transforms()
+# INVERSES[t][square] is where square ends up after transform t
+INVERSES = tuple(
+    tuple(perm.index(square) for square in range(9)) for perm in TRANSFORMS
+)
+
+_canonical_cache = {}
+
+
+def transform(state, t):
+    return tuple(state[i] for i in TRANSFORMS[t])
+
+
+def canonicalize(state):
+    # Smallest of the 8 symmetric images, and the transform that produces it
+    state = tuple(state)
+    cached = _canonical_cache.get(state)
+    if cached is None:
+        cached = min((transform(state, t), t) for t in range(len(TRANSFORMS)))
+        _canonical_cache[state] = cached
+    return cached
+
+
+def canonical_key(state, action):
+    # Q-table key for (state, action) with the action moved through the same transform
+    canonical, t = canonicalize(state)
+    return canonical, INVERSES[t][action]
+
+
+def orbit_size(state):
+    # Number of distinct boards that are symmetric images of state (1 to 8)
+    return len({transform(state, t) for t in range(len(TRANSFORMS))})
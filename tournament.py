@@ -0,0 +1,258 @@
+import argparse
+import random
+import time
+from itertools import combinations
+from multiprocessing import Pool
+import minimax
+import solution_table
+from game import TicTacToe
+
+OPPONENT = {"X": "O", "O": "X"}
+
+
+class Player:
+    # Common interface: move(board, letter) returns a square for letter to play
+    name = "player"
+
+    def seed(self, seed):
+        self.rng = random.Random(seed)
+
+    def move(self, board, letter):
+        raise NotImplementedError
+
+
+class RandomPlayer(Player):
+    name = "random"
+
+    def move(self, board, letter):
+        return self.rng.choice([i for i in range(9) if board[i] == " "])
+
+
+class MinimaxPlayer(Player):
+    # Perfect play: the solution table when it covers the position, else alpha-beta
+    name = "minimax"
+
+    def move(self, board, letter):
+        _, moves, side = solution_table.best_moves([board])[0]
+        if side == letter and moves:
+            return moves[0]
+        return minimax.best_move_alphabeta(list(board), letter, table=None)
+
+
+class MCTSPlayer(Player):
+    name = "mcts"
+
+    def __init__(self, iterations=1000):
+        self.iterations = iterations
+
+    def move(self, board, letter):
+        import mcts
+
+        return mcts.best_move(
+            board, letter, iterations=self.iterations, seed=self.rng.getrandbits(32)
+        )
+
+
+class QLearningPlayer(Player):
+    # Greedy policy of a trained QLearningAI (ties broken at random)
+    def __init__(self, name, q_ai):
+        self.name = name
+        self.q_ai = q_ai
+
+    def move(self, board, letter):
+        state = tuple(board)
+        state_key = getattr(self.q_ai, "state_key", lambda s, a: (s, a))
+        q_table = self.q_ai.q_table
+        moves = [i for i in range(9) if state[i] == " "]
+        values = [q_table.get(state_key(state, move), 0) for move in moves]
+        best = max(values)
+        return self.rng.choice([m for m, q in zip(moves, values) if q == best])
+
+
+def trained_agents(train_games, seed=None):
+    # One QLearningPlayer per QLearningAI variant, trained as X against Minimax AI
+    from trainer import Trainer, make_agent
+    from QLearnerAIDraw import QLearningAI as DrawQLearningAI
+
+    players = []
+    agents = [
+        ("qlearner", make_agent("qlearner")),
+        ("dynamic", make_agent("dynamic")),
+        ("qlearner-draw", DrawQLearningAI()),
+    ]
+    for name, q_ai in agents:
+        if seed is not None:
+            random.seed(seed)
+        Trainer(q_ai).train(train_games)
+        players.append(QLearningPlayer(name, q_ai))
+    return players
+
+
+def play_match(args):
+    # Worker task: games between two players, alternating who plays X.
+    # Returns (first's wins, draws, second's wins, latencies per player in seconds)
+    first, second, games, seed = args
+    first.seed(seed)
+    second.seed(seed + 1)
+    wins = draws = losses = 0
+    latencies = {first.name: [], second.name: []}
+    game = TicTacToe()
+    for index in range(games):
+        sides = {"X": first, "O": second}
+        if index % 2:
+            sides = {"X": second, "O": first}
+        game.reset()
+        letter = "X"
+        while not game.is_over():
+            player = sides[letter]
+            start = time.perf_counter()
+            move = player.move(game.state(), letter)
+            latencies[player.name].append(time.perf_counter() - start)
+            game.make_move(move, letter)
+            letter = OPPONENT[letter]
+        if game.current_winner is None:
+            draws += 1
+        elif sides[game.current_winner] is first:
+            wins += 1
+        else:
+            losses += 1
+    return wins, draws, losses, latencies
+
+
+def elo_ratings(names, scores, games, iterations=2000):
+    # Maximum-likelihood Elo from pairwise scores (wins + draws / 2). One virtual
+    # draw per pairing keeps perfect scores finite. Ratings are centred on 1500.
+    ratings = {name: 0.0 for name in names}
+    for _ in range(iterations):
+        change = 0.0
+        for name in names:
+            actual = expected = 0.0
+            for other in names:
+                played = games.get((name, other), 0)
+                if other == name or not played:
+                    continue
+                actual += scores[(name, other)] + 0.5
+                expected += (played + 1) / (
+                    1 + 10 ** ((ratings[other] - ratings[name]) / 400)
+                )
+            step = 100 * (actual - expected) / max(expected, 1)
+            ratings[name] += step
+            change = max(change, abs(step))
+        if change < 1e-6:
+            break
+    mean = sum(ratings.values()) / len(ratings)
+    return {name: 1500 + rating - mean for name, rating in ratings.items()}
+
+
+def elo_with_intervals(names, results, samples=200, seed=0):
+    # Elo plus a 95% bootstrap interval from resampling each pairing's games
+    def ratings_for(pair_results):
+        scores, games = {}, {}
+        for (a, b), (wins, draws, losses) in pair_results.items():
+            total = wins + draws + losses
+            scores[(a, b)] = wins + draws / 2
+            scores[(b, a)] = losses + draws / 2
+            games[(a, b)] = games[(b, a)] = total
+        return elo_ratings(names, scores, games)
+
+    point = ratings_for(results)
+    rng = random.Random(seed)
+    draws_by_name = {name: [] for name in names}
+    for _ in range(samples):
+        resampled = {}
+        for pair, (wins, draws, losses) in results.items():
+            total = wins + draws + losses
+            outcomes = rng.choices(
+                ("w", "d", "l"), weights=(wins, draws, losses), k=total
+            )
+            resampled[pair] = tuple(outcomes.count(kind) for kind in "wdl")
+        for name, rating in ratings_for(resampled).items():
+            draws_by_name[name].append(rating)
+    intervals = {}
+    for name, values in draws_by_name.items():
+        values.sort()
+        intervals[name] = (
+            values[int(0.025 * (samples - 1))],
+            values[int(0.975 * (samples - 1))],
+        )
+    return point, intervals
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def round_robin(players, games=100, workers=1, seed=0):
+    # Every pair plays `games` games with sides swapped each game
+    tasks = [
+        (first, second, games, seed + 2 * index)
+        for index, (first, second) in enumerate(combinations(players, 2))
+    ]
+    if workers > 1:
+        # Build the solution table once here rather than racing in every worker
+        solution_table.load_table()
+        with Pool(workers) as pool:
+            outcomes = pool.map(play_match, tasks)
+    else:
+        outcomes = [play_match(task) for task in tasks]
+
+    results = {}
+    latencies = {player.name: [] for player in players}
+    for (first, second, _, _), (wins, draws, losses, times) in zip(tasks, outcomes):
+        results[(first.name, second.name)] = (wins, draws, losses)
+        for name, values in times.items():
+            latencies[name].extend(values)
+    return results, latencies
+
+
+def print_report(players, results, latencies):
+    names = [player.name for player in players]
+    width = max(len(name) for name in names) + 2
+
+    print("Win/draw/loss of row player against column player")
+    print(" " * width + "".join(f"{name:>{width + 6}}" for name in names))
+    for row in names:
+        cells = []
+        for column in names:
+            if row == column:
+                cells.append("-")
+            elif (row, column) in results:
+                wins, draws, losses = results[(row, column)]
+                cells.append(f"{wins}/{draws}/{losses}")
+            else:
+                losses, draws, wins = results[(column, row)]
+                cells.append(f"{wins}/{draws}/{losses}")
+        print(f"{row:<{width}}" + "".join(f"{cell:>{width + 6}}" for cell in cells))
+
+    ratings, intervals = elo_with_intervals(names, results)
+    print("\nElo (95% interval)          move latency p50 / p90 / p99 (ms)")
+    for name in sorted(names, key=ratings.get, reverse=True):
+        low, high = intervals[name]
+        times = latencies[name]
+        p50, p90, p99 = (percentile(times, f) * 1000 for f in (0.5, 0.9, 0.99))
+        print(
+            f"{name:<{width}} {ratings[name]:7.0f} ({low:.0f} to {high:.0f})   "
+            f"{p50:8.3f} / {p90:8.3f} / {p99:8.3f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Round-robin tournament with Elo")
+    parser.add_argument("--games", type=int, default=100, help="games per pairing")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--train-games", type=int, default=5000)
+    parser.add_argument("--mcts", action="store_true", help="include an MCTS player")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    players = [MinimaxPlayer(), RandomPlayer()]
+    players += trained_agents(args.train_games, args.seed)
+    if args.mcts:
+        players.append(MCTSPlayer())
+    results, latencies = round_robin(players, args.games, args.workers, args.seed)
+    print_report(players, results, latencies)
+
+
+if __name__ == "__main__":
+    main()
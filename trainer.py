@@ -0,0 +1,243 @@
+import argparse
+import os
+import random
+import time
+from game import TicTacToe
+from solution_table import best_move
+from checkpoint import CheckpointWriter, load_checkpoint
+from convergence import ConvergenceMonitor
+from metrics import MetricsSink
+
+# Rewards given to the Q-learning AI (X) right after its own move; "loss" is only
+# seen by episode-level learners, which are rewarded after Minimax AI's reply
+DEFAULT_REWARDS = {"win": 1, "draw": 0.4, "loss": -1, "ongoing": 0}
+
+
+class Trainer:
+    # Headless Q AI (X) vs Minimax AI (O) training loop; the GUIs watch it via callbacks
+    def __init__(
+        self,
+        q_ai,
+        game=None,
+        rewards=None,
+        opponent=best_move,
+        replay=None,
+        batch_size=32,
+        updates_per_step=1,
+    ):
+        self.q_ai = q_ai
+        self.game = game if game is not None else TicTacToe()
+        self.rewards = dict(DEFAULT_REWARDS, **(rewards or {}))
+        self.opponent = opponent
+        # With a ReplayBuffer, transitions are stored and learned from in batches
+        self.replay = replay
+        self.batch_size = batch_size
+        self.updates_per_step = updates_per_step
+        # Agents with a trace_decay learn from whole games instead of single moves
+        self.episodic = getattr(q_ai, "trace_decay", None) is not None
+        self.trajectory = []
+        self.stats = {"Q AI": 0, "Minimax AI": 0, "Draws": 0}
+        self.games_played = 0
+        self.elapsed = 0.0
+
+    def step(self):
+        game = self.game
+        # Q-learning AI move
+        state = game.state()
+        if game.free:
+            move = self.q_ai.choose_action(state, game.available_moves())
+            game.make_move(move, "X")
+            if self.episodic:
+                # Rewarded in play_game once Minimax AI's reply has settled the game
+                self.trajectory.append((state, move, self.rewards["ongoing"]))
+            else:
+                self.learn_move(state, move)
+
+        # Minimax AI move
+        if not game.is_over():
+            move = self.opponent(game.board)
+            game.make_move(move, "O")
+
+    def learn_move(self, state, move):
+        # One-step update right after X's move
+        game = self.game
+        # Check if the game has ended after the Q-learning move
+        if game.current_winner == "X":
+            reward = self.rewards["win"]
+        elif not game.free:  # Draw situation
+            reward = self.rewards["draw"]
+        else:
+            reward = self.rewards["ongoing"]
+
+        next_state = game.state()
+        if self.replay is None:
+            self.q_ai.update_q_table(
+                state, move, reward, next_state, game.available_moves()
+            )
+        else:
+            self.replay.add(
+                state,
+                move,
+                reward,
+                next_state,
+                game.available_moves(),
+                done=game.is_over(),
+            )
+            for _ in range(self.updates_per_step):
+                self.replay.train(self.q_ai, self.batch_size)
+
+    def play_game(self, on_move=None):
+        self.game.reset()
+        self.trajectory = []
+        while not self.game.is_over():
+            self.step()
+            if on_move is not None:
+                on_move()
+
+        winner = self.game.current_winner
+        if self.episodic:
+            # The outcome, including a loss on Minimax AI's reply, goes to X's last move
+            outcome = {"X": "win", "O": "loss", None: "draw"}[winner]
+            state, move, _ = self.trajectory[-1]
+            self.trajectory[-1] = (state, move, self.rewards[outcome])
+            self.q_ai.learn_episode(self.trajectory)
+        if winner == "X":
+            self.stats["Q AI"] += 1
+        elif winner == "O":
+            self.stats["Minimax AI"] += 1
+        else:
+            self.stats["Draws"] += 1
+        self.games_played += 1
+        return winner
+
+    def train(self, games, on_move=None, on_game=None, monitor=None):
+        # Plays up to `games` games, stopping early once a ConvergenceMonitor agrees
+        start = time.perf_counter()
+        try:
+            for _ in range(games):
+                self.play_game(on_move)
+                if on_game is not None:
+                    on_game()
+                if monitor is not None and monitor.update(self.games_played):
+                    break
+        finally:
+            self.elapsed += time.perf_counter() - start
+        return self.stats
+
+    def games_per_second(self):
+        return self.games_played / self.elapsed if self.elapsed else 0.0
+
+
+def make_agent(name, canonical=False, dense=False, trace_decay=None):
+    # Same agent settings as 1v1GUIDrawReward.py ("qlearner") and DynamicGUI.py ("dynamic")
+    if name == "dynamic":
+        from DynamicQlearner import QLearningAI
+
+        return QLearningAI(
+            alpha=0.9,
+            gamma=0.95,
+            epsilon=1.0,
+            decay_rate=0.001,
+            max_trials=10000,
+            canonical=canonical,
+            dense=dense,
+            trace_decay=trace_decay,
+        )
+    from QlearnerAI import QLearningAI
+
+    return QLearningAI(canonical=canonical, dense=dense, trace_decay=trace_decay)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train a Q AI against Minimax AI")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--agent", choices=["qlearner", "dynamic"], default="qlearner")
+    parser.add_argument("--canonical", action="store_true")
+    parser.add_argument("--dense", action="store_true", help="NumPy Q-table")
+    parser.add_argument(
+        "--trace-decay", type=float, default=None, help="learn per game with lambda"
+    )
+    parser.add_argument("--loss-reward", type=float, default=DEFAULT_REWARDS["loss"])
+    parser.add_argument("--replay", type=int, default=0, help="replay capacity")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--updates-per-step", type=int, default=1)
+    parser.add_argument("--win-reward", type=float, default=DEFAULT_REWARDS["win"])
+    parser.add_argument("--draw-reward", type=float, default=DEFAULT_REWARDS["draw"])
+    parser.add_argument(
+        "--ongoing-reward", type=float, default=DEFAULT_REWARDS["ongoing"]
+    )
+    parser.add_argument(
+        "--converge-window", type=int, default=0, help="games per stability check"
+    )
+    parser.add_argument("--converge-threshold", type=float, default=1e-3)
+    parser.add_argument("--metrics", default=None, help="CSV or JSONL output path")
+    parser.add_argument("--metrics-window", type=int, default=100)
+    parser.add_argument("--flush-every", type=int, default=500)
+    parser.add_argument("--report-every", type=int, default=0)
+    parser.add_argument("--checkpoint", default=None, help="resume from/save to")
+    parser.add_argument("--checkpoint-every", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    replay = None
+    if args.replay:
+        from replay_buffer import ReplayBuffer  # NumPy is only needed for this
+
+        replay = ReplayBuffer(args.replay, seed=args.seed)
+    trainer = Trainer(
+        make_agent(args.agent, args.canonical, args.dense, args.trace_decay),
+        rewards={
+            "win": args.win_reward,
+            "draw": args.draw_reward,
+            "loss": args.loss_reward,
+            "ongoing": args.ongoing_reward,
+        },
+        replay=replay,
+        batch_size=args.batch_size,
+        updates_per_step=args.updates_per_step,
+    )
+
+    writer = None
+    if args.checkpoint:
+        if os.path.exists(args.checkpoint):
+            load_checkpoint(trainer.q_ai, args.checkpoint)
+            print(f"Resumed from {args.checkpoint}")
+        writer = CheckpointWriter(
+            trainer.q_ai, args.checkpoint, every=args.checkpoint_every
+        )
+
+    metrics = MetricsSink(args.metrics, args.metrics_window, args.flush_every)
+
+    def report():
+        metrics.record(trainer.game.current_winner)
+        if args.report_every and trainer.games_played % args.report_every == 0:
+            rates = ", ".join(f"{k} {v:.2f}" for k, v in metrics.rates().items())
+            print(f"{trainer.games_played} games: {trainer.stats} (last {rates})")
+        if writer is not None:
+            writer.maybe_save(trainer.games_played)
+
+    monitor = None
+    if args.converge_window:
+        monitor = ConvergenceMonitor(
+            trainer.q_ai, args.converge_window, args.converge_threshold
+        )
+
+    try:
+        trainer.train(args.games, on_game=report, monitor=monitor)
+    finally:
+        if writer is not None:
+            writer.close()
+        metrics.close()
+    if monitor is not None and monitor.converged_at is not None:
+        print(f"Converged after {monitor.converged_at} games")
+    print(f"Stats: {trainer.stats}")
+    print(
+        f"{trainer.games_played} games in {trainer.elapsed:.2f}s "
+        f"({trainer.games_per_second():.0f} games/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import argparse
+import time
+import numpy as np
+import solution_table
+from bitboard import WIN_TABLE
+from symmetry import canonical_key
+
+EMPTY, X, O = 0, 1, 2  # cell codes, matching the base-3 digits of solution_table
+LETTERS = (" ", "X", "O")
+DEFAULT_REWARDS = {"win": 1, "draw": 0.4, "loss": -1, "ongoing": 0}
+
+SQUARE_BITS = 1 << np.arange(9, dtype=np.int32)
+POWERS = 3 ** np.arange(9, dtype=np.int32)
+WIN_LOOKUP = np.array(WIN_TABLE, dtype=bool)  # 9-bit mask -> holds a complete line
+# Lowest set square of a 9-bit move mask, or -1 for an empty mask
+LOWEST_SQUARE = np.array(
+    [(mask & -mask).bit_length() - 1 for mask in range(512)], dtype=np.int8
+)
+
+
+def line_wins(boards, player):
+    # Batched win check: pack each player's squares into 9 bits, then one table lookup
+    return WIN_LOOKUP[(boards == player).astype(np.int32) @ SQUARE_BITS]
+
+
+def position_codes(boards):
+    return boards.astype(np.int32) @ POWERS
+
+
+def random_legal(boards, rng):
+    # Uniform random empty square per board (boards must have at least one)
+    return np.argmax(rng.random(boards.shape) * (boards == EMPTY), axis=1)
+
+
+class VecTicTacToe:
+    # N games in lockstep: the learner plays X, the opponent replies as O inside step()
+    def __init__(self, num_envs, opponent="minimax", rewards=None, seed=None):
+        self.num_envs = num_envs
+        self.opponent = opponent
+        self.rewards = dict(DEFAULT_REWARDS, **(rewards or {}))
+        self.rng = np.random.default_rng(seed)
+        self.boards = np.zeros((num_envs, 9), dtype=np.int8)
+        self.stats = {"Q AI": 0, "Minimax AI": 0, "Draws": 0}
+        self.moves_played = 0
+        if opponent == "minimax":
+            # Optimal-move masks straight from the memory-mapped perfect-play table
+            table = solution_table.load_table()
+            self.solution = np.frombuffer(
+                table.data,
+                dtype="<u2",
+                count=solution_table.NUM_POSITIONS,
+                offset=solution_table.HEADER.size,
+            )
+
+    def reset(self):
+        self.boards[:] = EMPTY
+        return self.boards.copy()
+
+    def legal_mask(self):
+        return self.boards == EMPTY
+
+    def opponent_moves(self, boards):
+        if self.opponent == "minimax":
+            return LOWEST_SQUARE[self.solution[position_codes(boards)] & 0x1FF]
+        return random_legal(boards, self.rng)
+
+    def step(self, actions):
+        # Apply one X move per board, then the O reply on boards still in play.
+        # Returns the boards after the moves, X's rewards, done flags and winners
+        # (X, O, or EMPTY for a draw or ongoing game); finished boards are reset.
+        rows = np.arange(self.num_envs)
+        boards = self.boards
+        if not np.all(boards[rows, actions] == EMPTY):
+            raise ValueError("step() got a move to an occupied square")
+        boards[rows, actions] = X
+        x_wins = line_wins(boards, X)
+        full = ~(boards == EMPTY).any(axis=1)
+
+        playing = ~(x_wins | full)
+        o_wins = np.zeros(self.num_envs, dtype=bool)
+        if playing.any():
+            live = np.flatnonzero(playing)
+            boards[live, self.opponent_moves(boards[live])] = O
+            o_wins[live] = line_wins(boards[live], O)
+            full = ~(boards == EMPTY).any(axis=1)
+        self.moves_played += self.num_envs + int(playing.sum())
+
+        draws = full & ~x_wins & ~o_wins
+        dones = x_wins | o_wins | draws
+        rewards = np.full(self.num_envs, self.rewards["ongoing"], dtype=np.float32)
+        rewards[x_wins] = self.rewards["win"]
+        rewards[o_wins] = self.rewards["loss"]
+        rewards[draws] = self.rewards["draw"]
+        winners = np.where(x_wins, X, np.where(o_wins, O, EMPTY)).astype(np.int8)
+
+        self.stats["Q AI"] += int(x_wins.sum())
+        self.stats["Minimax AI"] += int(o_wins.sum())
+        self.stats["Draws"] += int(draws.sum())
+
+        next_boards = boards.copy()
+        boards[dones] = EMPTY  # auto-reset finished games
+        return next_boards, rewards, dones, winners
+
+
+def all_boards():
+    # Every base-3 code decoded into a board row: ALL_BOARDS[code] -> (9,) cells
+    codes = np.arange(solution_table.NUM_POSITIONS)
+    return ((codes[:, None] // POWERS) % 3).astype(np.int8)
+
+
+class BatchedPolicy:
+    # Greedy/epsilon-greedy action selection for many boards from a QLearningAI
+    # q_table; refresh() copies the dict into a dense (positions x 9) array
+    def __init__(self, q_ai, seed=None):
+        self.q_ai = q_ai
+        self.rng = np.random.default_rng(seed)
+        self.values = np.zeros((solution_table.NUM_POSITIONS, 9), dtype=np.float32)
+        self.refresh()
+
+    def refresh(self):
+        q_table = self.q_ai.q_table
+        canonical = getattr(self.q_ai, "canonical", False)
+        self.values[:] = 0
+        for code, cells in enumerate(all_boards()):
+            state = tuple(LETTERS[cell] for cell in cells)
+            for action in range(9):
+                if cells[action] == EMPTY:
+                    key = (
+                        canonical_key(state, action) if canonical else (state, action)
+                    )
+                    self.values[code, action] = q_table.get(key, 0)
+
+    def greedy(self, boards):
+        legal = boards == EMPTY
+        q = np.where(legal, self.values[position_codes(boards)], -np.inf)
+        best = q == q.max(axis=1, keepdims=True)
+        # Random tie-break among equal Q-values, like QLearningAI.choose_action
+        return np.argmax(self.rng.random(boards.shape) * best, axis=1)
+
+    def select(self, boards, epsilon=0.0):
+        actions = self.greedy(boards)
+        if epsilon > 0:
+            explore = self.rng.random(len(boards)) < epsilon
+            if explore.any():
+                actions[explore] = random_legal(boards[explore], self.rng)
+        return actions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure vectorized simulation speed")
+    parser.add_argument("--envs", type=int, default=4096)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--opponent", choices=["minimax", "random"], default="minimax")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    env = VecTicTacToe(args.envs, opponent=args.opponent, seed=args.seed)
+    env.reset()
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        env.step(random_legal(env.boards, env.rng))
+    elapsed = time.perf_counter() - start
+    print(f"Stats: {env.stats}")
+    print(
+        f"{env.moves_played} moves in {elapsed:.2f}s "
+        f"({env.moves_played / elapsed:,.0f} moves/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()